@@ -8,6 +8,7 @@ from typing import Any
 
 import yaml
 
+from skillpack.utils.config import load_yaml
 from skillpack.utils.output import get_output_dir, write_text
 
 
@@ -16,8 +17,7 @@ def handler(args: argparse.Namespace) -> int:
     # Load metrics if provided
     metrics = {}
     if args.metrics and args.metrics.exists():
-        with open(args.metrics) as f:
-            metrics = yaml.safe_load(f) or {}
+        metrics = load_yaml(args.metrics)
 
     result = daily_ops_summary_main(
         date=args.date,
@@ -8,6 +8,7 @@ from typing import Any
 
 import yaml
 
+from skillpack.utils.config import load_yaml
 from skillpack.utils.output import get_output_dir, write_text
 
 
@@ -16,8 +17,7 @@ def handler(args: argparse.Namespace) -> int:
     # Load config if provided
     config = {}
     if args.config and args.config.exists():
-        with open(args.config) as f:
-            config = yaml.safe_load(f) or {}
+        config = load_yaml(args.config)
 
     result = feature_engineering_main(
         columns=config.get("columns", []),
@@ -3,13 +3,32 @@
 import argparse
 import json
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from textwrap import dedent
 from typing import Any
 
 from skillpack.utils.output import get_output_dir, write_text
 
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
+_IMPORT_PREFIXES = ("import ", "from ")
+_IMPORT_RE = re.compile(r"\s*(?:from|import)\s+(\w+)")
+
+# Imported top-level modules that are not added as package dependencies
+_STDLIB_MODULES = frozenset({
+    "argparse", "collections", "datetime", "functools", "itertools", "json",
+    "logging", "math", "os", "pathlib", "re", "sys", "time", "typing",
+})
+
 
 def handler(args: argparse.Namespace) -> int:
     """CLI handler for notebook-to-package."""
@@ -71,46 +90,43 @@ def notebook_to_package_main(
         package_name = notebook_path.stem.replace("-", "_").replace(" ", "_").lower()
 
     try:
-        # Parse notebook
-        with open(notebook_path, encoding="utf-8") as f:
-            notebook = json.load(f)
-
-        cells = notebook.get("cells", [])
-        
-        # Extract code and organize
-        modules = extract_modules(cells, package_name)
-        
-        files = []
-        
-        # Generate package __init__.py
-        init_code = generate_init(package_name, modules)
-        write_text(content=init_code, filename=f"{package_name}/__init__.py", skill_name="notebook_to_package", output_dir=output_dir)
-        files.append(f"{package_name}/__init__.py")
-
-        # Generate main module
-        main_code = generate_main_module(cells, package_name)
-        write_text(content=main_code, filename=f"{package_name}/core.py", skill_name="notebook_to_package", output_dir=output_dir)
-        files.append(f"{package_name}/core.py")
-
-        # Generate utils module
-        utils_code = generate_utils_module(cells)
-        write_text(content=utils_code, filename=f"{package_name}/utils.py", skill_name="notebook_to_package", output_dir=output_dir)
-        files.append(f"{package_name}/utils.py")
-
-        # Generate CLI entry point
-        cli_code = generate_cli(package_name)
-        write_text(content=cli_code, filename=f"{package_name}/cli.py", skill_name="notebook_to_package", output_dir=output_dir)
-        files.append(f"{package_name}/cli.py")
-
-        # Generate pyproject.toml
-        pyproject = generate_pyproject(package_name, cells)
-        write_text(content=pyproject, filename="pyproject.toml", skill_name="notebook_to_package", output_dir=output_dir)
-        files.append("pyproject.toml")
-
-        # Generate README
-        readme = generate_readme(package_name, cells)
-        write_text(content=readme, filename="README.md", skill_name="notebook_to_package", output_dir=output_dir)
-        files.append("README.md")
+        # Parse notebook straight from bytes; orjson decodes UTF-8 itself
+        notebook = _json_loads(notebook_path.read_bytes())
+
+        # Only cell types and sources are used; dropping the rest lets
+        # outputs (often large embedded images) be freed straight away
+        cells = [
+            {"cell_type": cell.get("cell_type"), "source": cell.get("source", [])}
+            for cell in notebook.get("cells", [])
+        ]
+        del notebook
+
+        # Extract code and organize in a single pass over the cells
+        contents = scan_notebook(cells)
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+        outputs = [
+            # Package __init__.py
+            (f"{package_name}/__init__.py", generate_init(package_name, contents.modules, timestamp)),
+            # Main module
+            (f"{package_name}/core.py", generate_main_module(contents, package_name, timestamp)),
+            # Utils module
+            (f"{package_name}/utils.py", generate_utils_module(cells, timestamp)),
+            # CLI entry point
+            (f"{package_name}/cli.py", generate_cli(package_name)),
+            ("pyproject.toml", generate_pyproject(package_name, contents)),
+            ("README.md", generate_readme(package_name, contents)),
+        ]
+
+        # The writes are independent, so overlap their I/O on a thread pool
+        def write_output(output: tuple[str, str]) -> Path:
+            filename, content = output
+            return write_text(content=content, filename=filename, skill_name="notebook_to_package", output_dir=output_dir)
+
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            list(executor.map(write_output, outputs))
+        files = [filename for filename, _ in outputs]
 
         return {
             "success": True,
@@ -126,89 +142,97 @@ def notebook_to_package_main(
         return {"success": False, "error": str(e)}
 
 
-def extract_modules(cells: list[dict], package_name: str) -> dict[str, list[str]]:
-    """Extract code into logical modules."""
-    modules = {"imports": [], "functions": [], "classes": [], "main": []}
-    
-    for cell in cells:
-        if cell.get("cell_type") != "code":
-            continue
-        source = "".join(cell.get("source", []))
-        
-        # Categorize code
-        for line in source.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith(("import ", "from ")):
-                modules["imports"].append(line)
-            elif stripped.startswith("def "):
-                modules["functions"].append(source)
-                break
-            elif stripped.startswith("class "):
-                modules["classes"].append(source)
-                break
-    
-    return modules
+@dataclass
+class NotebookContents:
+    """Code and documentation gathered from a notebook's cells."""
 
+    modules: dict[str, list[str]] = field(
+        default_factory=lambda: {"imports": [], "functions": [], "classes": [], "main": []}
+    )
+    functions: list[str] = field(default_factory=list)
+    dependencies: set[str] = field(default_factory=set)
+    docs: list[str] = field(default_factory=list)
 
-def generate_init(package_name: str, modules: dict) -> str:
-    """Generate __init__.py."""
-    return dedent(f'''\
-        """{package_name} - Generated from Jupyter notebook.
-        
-        Generated by skillpack notebook-to-package on {datetime.now().strftime("%Y-%m-%d %H:%M")}
-        """
-
-        from {package_name}.core import *
-        from {package_name}.utils import *
-
-        __version__ = "0.1.0"
-        __all__ = ["main", "run"]
-    ''')
 
+def scan_notebook(cells: list[dict]) -> NotebookContents:
+    """Scan notebook cells once, collecting everything the generators need."""
+    contents = NotebookContents()
+    modules = contents.modules
 
-def generate_main_module(cells: list[dict], package_name: str) -> str:
-    """Generate core.py with main logic."""
-    code_cells = [c for c in cells if c.get("cell_type") == "code"]
-    
-    # Extract imports
-    imports = set()
-    functions = []
-    other_code = []
-    
-    for cell in code_cells:
+    for cell in cells:
+        cell_type = cell.get("cell_type")
+        if cell_type == "markdown":
+            contents.docs.append("".join(cell.get("source", [])))
+            continue
+        if cell_type != "code":
+            continue
         source = "".join(cell.get("source", []))
-        lines = source.split("\n")
-        
+
+        # The first def/class decides the cell's module category
+        category = None
         in_function = False
         current_function = []
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            if stripped.startswith(("import ", "from ")):
-                imports.add(line)
-            elif stripped.startswith("def ") or in_function:
+
+        for line in source.splitlines():
+            stripped = line.lstrip()
+
+            if stripped.startswith(_IMPORT_PREFIXES):
+                modules["imports"].append(line)
+                match = _IMPORT_RE.match(stripped)
+                if match and (pkg := match.group(1).lower()) not in _STDLIB_MODULES:
+                    contents.dependencies.add(pkg)
+                continue
+
+            if category is None:
+                if stripped.startswith("def "):
+                    category = "functions"
+                elif stripped.startswith("class "):
+                    category = "classes"
+
+            # Top-level function bodies end at the next unindented line
+            if stripped.startswith("def ") or in_function:
                 in_function = True
                 current_function.append(line)
-                if line.strip() and not line.startswith(" ") and not stripped.startswith("def "):
-                    functions.append("\n".join(current_function[:-1]))
+                if stripped and not line.startswith(" ") and not stripped.startswith("def "):
+                    contents.functions.append("\n".join(current_function[:-1]))
                     in_function = False
                     current_function = []
-                    other_code.append(line)
-            elif not stripped.startswith("#") and stripped:
-                other_code.append(line)
-        
+
+        if category:
+            modules[category].append(source)
         if current_function:
-            functions.append("\n".join(current_function))
-    
-    imports_str = "\n".join(sorted(imports))
-    functions_str = "\n\n\n".join(functions) if functions else "pass"
-    
-    return dedent(f'''\
-        """{package_name} core module.
-        
-        Generated from Jupyter notebook on {datetime.now().strftime("%Y-%m-%d %H:%M")}
-        """
+            contents.functions.append("\n".join(current_function))
+
+    return contents
+
+
+_INIT_TEMPLATE = '''\
+"""{package_name} - Generated from Jupyter notebook.
+
+Generated by skillpack notebook-to-package on {timestamp}
+"""
+
+from {package_name}.core import *
+from {package_name}.utils import *
+
+__version__ = "0.1.0"
+__all__ = ["main", "run"]
+'''
+
+
+def generate_init(package_name: str, modules: dict, timestamp: str) -> str:
+    """Generate __init__.py."""
+    return _INIT_TEMPLATE.format(
+        package_name=package_name,
+        timestamp=timestamp,
+    )
+
+
+_CORE_TEMPLATE = '''\
+"""{package_name} core module.
+
+Generated from Jupyter notebook on {timestamp}
+"""
 
 {imports_str}
 
@@ -220,7 +244,7 @@ def main():
     """Main entry point."""
     print("Running {package_name}...")
     # TODO: Add main logic from notebook
-    
+
 
 def run(**kwargs):
     """Run with keyword arguments."""
@@ -229,193 +253,211 @@ def run(**kwargs):
 
 if __name__ == "__main__":
     main()
-    ''')
+'''
+
+
+def generate_main_module(contents: NotebookContents, package_name: str, timestamp: str) -> str:
+    """Generate core.py with main logic."""
+    imports_str = "\n".join(sorted(set(contents.modules["imports"])))
+    functions_str = "\n\n\n".join(contents.functions) if contents.functions else "pass"
+    
+    return _CORE_TEMPLATE.format(
+        package_name=package_name,
+        timestamp=timestamp,
+        imports_str=imports_str,
+        functions_str=functions_str,
+    )
+
+
+_UTILS_TEMPLATE = '''\
+"""{timestamp} - Utility functions."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(level: str = "INFO") -> None:
+    """Configure logging."""
+    logging.basicConfig(
+        level=getattr(logging, level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
 
+def load_data(path: Path) -> Any:
+    """Load data from file."""
+    import pandas as pd
+    
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return pd.read_csv(path)
+    elif suffix == ".parquet":
+        return pd.read_parquet(path)
+    elif suffix == ".json":
+        return pd.read_json(path)
+    else:
+        raise ValueError(f"Unsupported format: {{suffix}}")
+
+
+def save_data(data: Any, path: Path) -> None:
+    """Save data to file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        data.to_csv(path, index=False)
+    elif suffix == ".parquet":
+        data.to_parquet(path, index=False)
+    elif suffix == ".json":
+        data.to_json(path, orient="records")
+    else:
+        raise ValueError(f"Unsupported format: {{suffix}}")
+'''
 
-def generate_utils_module(cells: list[dict]) -> str:
+
+def generate_utils_module(cells: list[dict], timestamp: str) -> str:
     """Generate utils.py with helper functions."""
-    return dedent(f'''\
-        """{datetime.now().strftime("%Y-%m-%d %H:%M")} - Utility functions."""
-
-        import logging
-        from pathlib import Path
-        from typing import Any
-
-
-        logger = logging.getLogger(__name__)
-
-
-        def setup_logging(level: str = "INFO") -> None:
-            """Configure logging."""
-            logging.basicConfig(
-                level=getattr(logging, level.upper()),
-                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            )
-
-
-        def load_data(path: Path) -> Any:
-            """Load data from file."""
-            import pandas as pd
-            
-            suffix = path.suffix.lower()
-            if suffix == ".csv":
-                return pd.read_csv(path)
-            elif suffix == ".parquet":
-                return pd.read_parquet(path)
-            elif suffix == ".json":
-                return pd.read_json(path)
-            else:
-                raise ValueError(f"Unsupported format: {{suffix}}")
-
-
-        def save_data(data: Any, path: Path) -> None:
-            """Save data to file."""
-            path.parent.mkdir(parents=True, exist_ok=True)
-            
-            suffix = path.suffix.lower()
-            if suffix == ".csv":
-                data.to_csv(path, index=False)
-            elif suffix == ".parquet":
-                data.to_parquet(path, index=False)
-            elif suffix == ".json":
-                data.to_json(path, orient="records")
-            else:
-                raise ValueError(f"Unsupported format: {{suffix}}")
-    ''')
+    return _UTILS_TEMPLATE.format(
+        timestamp=timestamp,
+    )
+
+
+_CLI_TEMPLATE = '''\
+"""Command-line interface for {package_name}."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from {package_name}.core import main
+from {package_name}.utils import setup_logging
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="{package_name}",
+        description="{package_name} - converted from Jupyter notebook",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose output",
+    )
+    parser.add_argument(
+        "--input",
+        type=Path,
+        help="Input file path",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("./output"),
+        help="Output directory",
+    )
+    return parser
+
+
+def cli_main() -> int:
+    parser = create_parser()
+    args = parser.parse_args()
+    
+    setup_logging("DEBUG" if args.verbose else "INFO")
+    
+    try:
+        main()
+        return 0
+    except Exception as e:
+        print(f"Error: {{e}}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(cli_main())
+'''
 
 
 def generate_cli(package_name: str) -> str:
     """Generate CLI module."""
-    return dedent(f'''\
-        """Command-line interface for {package_name}."""
-
-        import argparse
-        import sys
-        from pathlib import Path
-
-        from {package_name}.core import main
-        from {package_name}.utils import setup_logging
-
-
-        def create_parser() -> argparse.ArgumentParser:
-            parser = argparse.ArgumentParser(
-                prog="{package_name}",
-                description="{package_name} - converted from Jupyter notebook",
-            )
-            parser.add_argument(
-                "-v", "--verbose",
-                action="store_true",
-                help="Enable verbose output",
-            )
-            parser.add_argument(
-                "--input",
-                type=Path,
-                help="Input file path",
-            )
-            parser.add_argument(
-                "--output",
-                type=Path,
-                default=Path("./output"),
-                help="Output directory",
-            )
-            return parser
-
-
-        def cli_main() -> int:
-            parser = create_parser()
-            args = parser.parse_args()
-            
-            setup_logging("DEBUG" if args.verbose else "INFO")
-            
-            try:
-                main()
-                return 0
-            except Exception as e:
-                print(f"Error: {{e}}", file=sys.stderr)
-                return 1
-
-
-        if __name__ == "__main__":
-            sys.exit(cli_main())
-    ''')
-
-
-def generate_pyproject(package_name: str, cells: list[dict]) -> str:
+    return _CLI_TEMPLATE.format(
+        package_name=package_name,
+    )
+
+
+_PYPROJECT_TEMPLATE = '''\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "{package_name}"
+version = "0.1.0"
+description = "{package_name} - converted from Jupyter notebook"
+requires-python = ">=3.10"
+dependencies = [
+    {deps_str}
+]
+
+[project.scripts]
+{package_name} = "{package_name}.cli:cli_main"
+
+[tool.hatch.build.targets.wheel]
+packages = ["{package_name}"]
+'''
+
+
+def generate_pyproject(package_name: str, contents: NotebookContents) -> str:
     """Generate pyproject.toml."""
-    # Extract dependencies from imports
-    deps = set()
-    for cell in cells:
-        if cell.get("cell_type") != "code":
-            continue
-        source = "".join(cell.get("source", []))
-        for line in source.split("\n"):
-            if line.strip().startswith(("import ", "from ")):
-                # Extract package name
-                match = re.match(r"(?:from|import)\s+(\w+)", line.strip())
-                if match:
-                    pkg = match.group(1)
-                    if pkg not in ("os", "sys", "re", "json", "typing", "pathlib", "collections", "itertools", "functools"):
-                        deps.add(pkg.lower())
-    
+    deps = contents.dependencies
     deps_str = ",\n    ".join([f'"{d}"' for d in sorted(deps)]) if deps else ""
     
-    return dedent(f'''\
-        [build-system]
-        requires = ["hatchling"]
-        build-backend = "hatchling.build"
-
-        [project]
-        name = "{package_name}"
-        version = "0.1.0"
-        description = "{package_name} - converted from Jupyter notebook"
-        requires-python = ">=3.10"
-        dependencies = [
-            {deps_str}
-        ]
+    return _PYPROJECT_TEMPLATE.format(
+        package_name=package_name,
+        deps_str=deps_str,
+    )
 
-        [project.scripts]
-        {package_name} = "{package_name}.cli:cli_main"
 
-        [tool.hatch.build.targets.wheel]
-        packages = ["{package_name}"]
-    ''')
+_README_TEMPLATE = '''\
+# {package_name}
 
+Generated from Jupyter notebook by skillpack notebook-to-package.
 
-def generate_readme(package_name: str, cells: list[dict]) -> str:
-    """Generate README.md."""
-    # Extract markdown cells for documentation
-    docs = []
-    for cell in cells:
-        if cell.get("cell_type") == "markdown":
-            docs.append("".join(cell.get("source", [])))
-    
-    docs_section = "\n\n".join(docs[:3]) if docs else "No documentation found in notebook."
-    
-    return dedent(f'''\
-        # {package_name}
+## Installation
 
-        Generated from Jupyter notebook by skillpack notebook-to-package.
+```bash
+pip install -e .
+```
 
-        ## Installation
+## Usage
 
-        ```bash
-        pip install -e .
-        ```
+### As a module
+```python
+from {package_name} import main
+main()
+```
 
-        ## Usage
+### From command line
+```bash
+{package_name} --input data.csv --output ./results
+```
 
-        ### As a module
-        ```python
-        from {package_name} import main
-        main()
-        ```
+## Original Notebook Documentation
 
-        ### From command line
-        ```bash
-        {package_name} --input data.csv --output ./results
-        ```
+{docs_section}
+'''
 
-        ## Original Notebook Documentation
 
-        {docs_section}
-    ''')
+def generate_readme(package_name: str, contents: NotebookContents) -> str:
+    """Generate README.md."""
+    # Markdown cells become the documentation section
+    docs = contents.docs
+
+    docs_section = "\n\n".join(docs[:3]) if docs else "No documentation found in notebook."
+    
+    return _README_TEMPLATE.format(
+        package_name=package_name,
+        docs_section=docs_section,
+    )
@@ -1,22 +1,188 @@
 """pipeline-doctor - Diagnose pipeline issues from logs and configs."""
 
 import argparse
+import contextlib
+import hashlib
+import os
+import pickle
 import re
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from textwrap import dedent
-from typing import Any
+from typing import Any, NamedTuple
 
+from skillpack.utils.config import load_yaml
 from skillpack.utils.output import get_output_dir, write_text
 
 
+class Issue(NamedTuple):
+    """A problem found in a log or config file."""
+
+    file: str
+    line: int
+    severity: str
+    description: str
+    content: str
+
+
+class Event(NamedTuple):
+    """A timestamped entry on the pipeline timeline."""
+
+    timestamp: str
+    type: str
+    file: str
+    content: str
+
+
+# Error patterns to look for, in priority order (first match wins per line)
+_LOG_PATTERNS = [
+    (r"error[:\s].+", "error", "Error detected"),
+    (r"exception[:\s].+", "error", "Exception detected"),
+    (r"failed[:\s].+", "error", "Failure detected"),
+    (r"traceback", "error", "Python traceback"),
+    (r"warning[:\s].+", "warning", "Warning detected"),
+    (r"timeout", "error", "Timeout detected"),
+    (r"out of memory|oom", "error", "Memory issue"),
+    (r"connection refused|connection reset", "error", "Connection issue"),
+    (r"permission denied", "error", "Permission issue"),
+    (r"disk full|no space left", "error", "Disk space issue"),
+    (r"rate limit|throttl", "warning", "Rate limiting"),
+    (r"retry|retrying", "warning", "Retry behavior"),
+]
+
+# Common error types. Categories can overlap on one line (e.g. an exception
+# type and its error class), so each is scanned on its own.
+_ERROR_TYPES = [
+    (re.compile(rb"(?:Error|Exception):\s*(\w+(?:Error|Exception))"), "exception_type"),
+    (re.compile(rb"HTTP\s+(\d{3})"), "http_status"),
+    (re.compile(rb"exit code[:\s]+(\d+)"), "exit_code"),
+    (re.compile(rb"(\w+Error):"), "error_class"),
+]
+
+# Literal fragments, at least one of which occurs in any line that can match
+# _LOG_PATTERNS or _ERROR_TYPES. Keep in sync when either table changes.
+_PREFILTER_SOURCE = (
+    r"(?i)error|exception|failed|traceback|warning|timeout|memory|oom|connection"
+    r"|permission denied|disk full|no space left|rate limit|throttl|retry|http|exit code"
+)
+
+# Site-specific issue patterns, checked before the built-in table
+_USER_PATTERNS_PATH = Path.home() / ".config" / "skillpack" / "pipeline_doctor" / "patterns.yaml"
+
+# Numbered backreferences and conditionals (\1, (?(1)...)) in a user pattern,
+# which would point at another pattern's group once joined into the matcher
+_NUMBERED_GROUP_REF_RE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
+# Timestamp formats (in priority order) and event-type keywords, each an
+# optional lookahead from the start of the line so one match() call reports
+# every piece the timeline needs.
+_TIMELINE_RE = re.compile(
+    rb"(?:(?=.*?(?P<iso>\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})))?"
+    rb"(?:(?=.*?(?P<us>\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2})))?"
+    rb"(?:(?=.*?(?P<error>(?i:error|exception|failed))))?"
+    rb"(?:(?=.*?(?P<start>(?i:start|begin|init))))?"
+    rb"(?:(?=.*?(?P<end>(?i:end|complete|finish|success))))?"
+    rb"(?:(?=.*?(?P<warning>(?i:warning))))?"
+)
+
+# Only the head of each log is sampled for timeline events
+_TIMELINE_SAMPLE_LINES = 500
+
+_READ_BUFFER_SIZE = 1 << 20
+
+# Cached analysis results; bump the version whenever analyze_log's output changes.
+# Only the most recently used entries are kept after each run.
+_CACHE_DIR = Path.home() / ".cache" / "skillpack" / "pipeline_doctor"
+_CACHE_VERSION = 1
+_CACHE_MAX_ENTRIES = 256
+
+# Minimum number of log files before analysis is spread across processes
+_PARALLEL_MIN_FILES = 3
+
+
+class LogMatcher(NamedTuple):
+    """Compiled issue patterns used to scan log lines."""
+
+    issues: re.Pattern[bytes]
+    meta: dict[str, tuple[str, str]]
+    prefilter: re.Pattern[bytes]
+
+
+def build_log_matcher(extra_patterns: list[tuple[str, str, str]] | None = None) -> LogMatcher:
+    """Compile the issue pattern table, with extra patterns taking priority.
+
+    Each pattern becomes a named lookahead branch tried in table order from
+    the start of the line, so a single match() call keeps the first-pattern-wins
+    priority and the group that fired identifies the entry. Matching is
+    case-insensitive and runs on bytes.
+    """
+    extra_patterns = extra_patterns or []
+    patterns = extra_patterns + _LOG_PATTERNS
+
+    issues = re.compile(
+        ("(?i)" + "|".join(
+            f"(?=.*?(?P<p{i}>{pattern}))" for i, (pattern, _, _) in enumerate(patterns)
+        )).encode()
+    )
+    meta = {
+        f"p{i}": (severity, description)
+        for i, (_, severity, description) in enumerate(patterns)
+    }
+    # Extra patterns have no known literal fragment, so they join the prefilter whole
+    prefilter = _PREFILTER_SOURCE + "".join(f"|{pattern}" for pattern, _, _ in extra_patterns)
+
+    return LogMatcher(issues, meta, re.compile(prefilter.encode()))
+
+
+_DEFAULT_MATCHER = build_log_matcher()
+
+
+def load_log_patterns(path: Path) -> list[tuple[str, str, str]]:
+    """Load site-specific issue patterns from a YAML file, if it exists.
+
+    The file holds a ``patterns`` list whose entries have ``pattern``,
+    ``severity`` and ``description`` keys. Each pattern is checked as part of
+    the combined matcher, so inline global flags such as ``(?i)``, duplicate
+    group names and numbered backreferences are rejected; use scoped flags
+    ``(?i:...)`` and named groups ``(?P<name>...)``/``(?P=name)`` instead.
+
+    Raises:
+        ValueError: If a pattern cannot be used in the combined matcher.
+    """
+    if not path.exists():
+        return []
+
+    patterns: list[tuple[str, str, str]] = []
+    for entry in load_yaml(path).get("patterns", []):
+        pattern = entry["pattern"]
+        if _NUMBERED_GROUP_REF_RE.search(pattern):
+            raise ValueError(
+                f"Invalid log pattern {pattern!r} in {path}: "
+                "numbered group references are not supported, use named groups"
+            )
+        candidate = (
+            pattern,
+            entry.get("severity", "error"),
+            entry.get("description", "Custom pattern"),
+        )
+        try:
+            build_log_matcher([*patterns, candidate])
+        except re.error as e:
+            raise ValueError(f"Invalid log pattern {pattern!r} in {path}: {e}") from e
+        patterns.append(candidate)
+    return patterns
+
+
 def handler(args: argparse.Namespace) -> int:
     """CLI handler for pipeline-doctor."""
     result = pipeline_doctor_main(
         log_path=args.logs,
         config_path=args.config,
         output_dir=args.output_dir,
+        use_cache=not args.no_cache,
     )
 
     if result.get("success"):
@@ -51,6 +217,11 @@ def register_parser(subparsers: Any) -> None:
         default=Path("./out/pipeline_doctor"),
         help="Output directory",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-scan every log instead of reusing cached results",
+    )
     parser.set_defaults(handler=handler)
 
 
@@ -58,8 +229,12 @@ def pipeline_doctor_main(
     log_path: Path,
     config_path: Path | None = None,
     output_dir: Path | None = None,
+    use_cache: bool = True,
+    patterns_path: Path | None = None,
 ) -> dict[str, Any]:
     """Diagnose pipeline issues from logs."""
+    if patterns_path is None:
+        patterns_path = _USER_PATTERNS_PATH
     if output_dir is None:
         output_dir = get_output_dir("pipeline_doctor")
     else:
@@ -79,19 +254,28 @@ def pipeline_doctor_main(
         error_patterns = []
         timeline = []
 
-        for log_file in log_files:
-            content = log_file.read_text(errors="ignore")
-            issues = analyze_log(log_file, content)
+        extra_patterns = load_log_patterns(patterns_path)
+        matcher = build_log_matcher(extra_patterns) if extra_patterns else _DEFAULT_MATCHER
+        analyze = partial(analyze_log_cached if use_cache else analyze_log, matcher=matcher)
+
+        # Log files are independent, so larger directories are fanned out
+        # across processes; small runs skip the pool start-up cost.
+        if len(log_files) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(analyze, log_files, chunksize=4))
+        else:
+            results = [analyze(log_file) for log_file in log_files]
+
+        if use_cache:
+            prune_log_cache(_CACHE_MAX_ENTRIES)
+
+        for issues, patterns, events in results:
             all_issues.extend(issues)
-            
-            patterns = extract_error_patterns(content)
             error_patterns.extend(patterns)
-            
-            events = extract_timeline(log_file, content)
             timeline.extend(events)
 
         # Sort timeline
-        timeline.sort(key=lambda x: x.get("timestamp", ""))
+        timeline.sort(key=lambda e: e.timestamp)
 
         # Analyze config if provided
         config_issues = []
@@ -99,23 +283,22 @@ def pipeline_doctor_main(
             config_issues = analyze_config(config_path)
             all_issues.extend(config_issues)
 
+        errors, warnings = split_by_severity(all_issues)
+
         # Generate diagnosis report
-        report = generate_diagnosis_report(all_issues, error_patterns, timeline)
+        report = generate_diagnosis_report(errors, warnings, error_patterns, timeline)
         write_text(content=report, filename="diagnosis.md", skill_name="pipeline_doctor", output_dir=output_dir)
 
         # Generate remediation suggestions
         remediation = generate_remediation(all_issues, error_patterns)
         write_text(content=remediation, filename="remediation.md", skill_name="pipeline_doctor", output_dir=output_dir)
 
-        error_count = len([i for i in all_issues if i["severity"] == "error"])
-        warning_count = len([i for i in all_issues if i["severity"] == "warning"])
-
         return {
             "success": True,
             "output_dir": str(output_dir),
             "files": ["diagnosis.md", "remediation.md"],
-            "error_count": error_count,
-            "warning_count": warning_count,
+            "error_count": len(errors),
+            "warning_count": len(warnings),
             "log_files_analyzed": len(log_files),
         }
 
@@ -123,103 +306,173 @@ def pipeline_doctor_main(
         return {"success": False, "error": str(e)}
 
 
-def analyze_log(log_file: Path, content: str) -> list[dict]:
-    """Analyze log content for issues."""
-    issues = []
-    lines = content.split("\n")
-
-    # Error patterns to look for
-    patterns = [
-        (r"(?i)error[:\s](.+)", "error", "Error detected"),
-        (r"(?i)exception[:\s](.+)", "error", "Exception detected"),
-        (r"(?i)failed[:\s](.+)", "error", "Failure detected"),
-        (r"(?i)traceback", "error", "Python traceback"),
-        (r"(?i)warning[:\s](.+)", "warning", "Warning detected"),
-        (r"(?i)timeout", "error", "Timeout detected"),
-        (r"(?i)out of memory|oom", "error", "Memory issue"),
-        (r"(?i)connection refused|connection reset", "error", "Connection issue"),
-        (r"(?i)permission denied", "error", "Permission issue"),
-        (r"(?i)disk full|no space left", "error", "Disk space issue"),
-        (r"(?i)rate limit|throttl", "warning", "Rate limiting"),
-        (r"(?i)retry|retrying", "warning", "Retry behavior"),
-    ]
+def analyze_log(
+    log_file: Path, matcher: LogMatcher = _DEFAULT_MATCHER
+) -> tuple[list[Issue], list[dict], list[Event]]:
+    """Analyze a log file for issues, error patterns and timeline events.
+
+    The file is streamed once, line by line, so memory stays bounded by the
+    longest line rather than the file size. Lines are matched as raw bytes and
+    only decoded when they are reported.
+    """
+    issues: list[Issue] = []
+    pattern_counts: Counter[str] = Counter()
+    events: list[Event] = []
+
+    with open(log_file, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        lines = enumerate(f, 1)
+
+        # Timeline events are only sampled from the head of the log
+        for lineno, line in islice(lines, _TIMELINE_SAMPLE_LINES):
+            line = line.rstrip(b"\r\n")
+            scan_line(matcher, log_file, lineno, line, issues, pattern_counts)
+            event = extract_timeline_event(log_file, line)
+            if event:
+                events.append(event)
+
+        for lineno, line in lines:
+            scan_line(matcher, log_file, lineno, line.rstrip(b"\r\n"), issues, pattern_counts)
+
+    return issues, summarize_error_patterns(pattern_counts), events
+
+
+def analyze_log_cached(
+    log_file: Path, matcher: LogMatcher = _DEFAULT_MATCHER
+) -> tuple[list[Issue], list[dict], list[Event]]:
+    """Analyze a log file, reusing the cached result if the file is unchanged.
+
+    Results are pickled under the user cache directory, keyed on the file's
+    path, modification time and size plus the issue patterns in use. Caching
+    is best-effort: an unreadable or unwritable cache falls back to a normal scan.
+    """
+    stat = log_file.stat()
+    digest = hashlib.blake2b(
+        f"{_CACHE_VERSION}:{log_file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+        digest_size=16,
+    )
+    digest.update(matcher.issues.pattern)
+    key = digest.hexdigest()
+    cache_path = _CACHE_DIR / f"{key}.pkl"
 
-    for i, line in enumerate(lines):
-        for pattern, severity, description in patterns:
-            if re.search(pattern, line):
-                issues.append({
-                    "file": str(log_file),
-                    "line": i + 1,
-                    "severity": severity,
-                    "description": description,
-                    "content": line[:200],
-                })
-                break
+    try:
+        with open(cache_path, "rb") as f:
+            cached: tuple[list[Issue], list[dict], list[Event]] = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Truncated, foreign or stale entries (e.g. pickled before a class was
+        # renamed) can raise almost anything; drop the entry and rescan
+        with contextlib.suppress(OSError):
+            cache_path.unlink()
+    else:
+        # Refresh the mtime so pruning treats the entry as recently used
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return cached
 
-    return issues
+    result = analyze_log(log_file, matcher)
 
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
-def extract_error_patterns(content: str) -> list[dict]:
-    """Extract common error patterns."""
-    patterns = defaultdict(int)
-    
-    # Common error types
-    error_types = [
-        (r"(?:Error|Exception):\s*(\w+(?:Error|Exception))", "exception_type"),
-        (r"HTTP\s+(\d{3})", "http_status"),
-        (r"exit code[:\s]+(\d+)", "exit_code"),
-        (r"(\w+Error):", "error_class"),
-    ]
+    return result
+
+
+def prune_log_cache(max_entries: int = _CACHE_MAX_ENTRIES) -> int:
+    """Delete all but the most recently used cached log analyses.
 
-    for pattern, category in error_types:
-        for match in re.finditer(pattern, content):
-            key = f"{category}:{match.group(1)}"
-            patterns[key] += 1
+    Pass ``max_entries=0`` to clear the cache completely.
+
+    Args:
+        max_entries: Number of cache entries to keep.
+
+    Returns:
+        Number of entries removed.
+    """
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            entries = [(e.stat().st_mtime_ns, e.path) for e in it if e.name.endswith(".pkl")]
+    except OSError:
+        return 0
 
+    entries.sort()
+    stale = entries[: max(len(entries) - max_entries, 0)]
+    removed = 0
+    for _, path in stale:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+            removed += 1
+    return removed
+
+
+def scan_line(
+    matcher: LogMatcher,
+    log_file: Path,
+    lineno: int,
+    line: bytes,
+    issues: list[Issue],
+    patterns: Counter[str],
+) -> None:
+    """Record any issue and error patterns found in a log line."""
+    # Most lines are informational; skip them with one cheap literal scan
+    if not matcher.prefilter.search(line):
+        return
+
+    match = matcher.issues.match(line)
+    if match:
+        # Every branch of the alternation is a named group, so one always fired
+        assert match.lastgroup is not None
+        severity, description = matcher.meta[match.lastgroup]
+        content = line.decode("utf-8", "ignore")[:200]
+        issues.append(Issue(str(log_file), lineno, severity, description, content))
+
+    extract_error_patterns(line, patterns)
+
+
+def extract_error_patterns(line: bytes, patterns: Counter[str]) -> None:
+    """Accumulate common error patterns found in a log line."""
+    # The captured values are ASCII-only (\w and \d match ASCII in bytes mode)
+    for pattern, category in _ERROR_TYPES:
+        patterns.update(f"{category}:{value.decode()}" for value in pattern.findall(line))
+
+
+def summarize_error_patterns(patterns: dict[str, int]) -> list[dict]:
+    """Return the most frequent error patterns."""
     return [
         {"pattern": k, "count": v, "category": k.split(":")[0]}
         for k, v in sorted(patterns.items(), key=lambda x: -x[1])[:20]
     ]
 
 
-def extract_timeline(log_file: Path, content: str) -> list[dict]:
-    """Extract timeline events from log."""
-    events = []
-    
-    # Common timestamp patterns
-    timestamp_patterns = [
-        r"(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})",
-        r"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2})",
-    ]
+def extract_timeline_event(log_file: Path, line: bytes) -> Event | None:
+    """Extract a timeline event from a log line, if it is timestamped."""
+    match = _TIMELINE_RE.match(line)
+    # Every part of the pattern is optional, so this only narrows the type
+    if match is None:
+        return None
+    timestamp = match["iso"] or match["us"]
+    if not timestamp:
+        return None
+
+    # Classify event type
+    event_type = "info"
+    for group in ("error", "start", "end", "warning"):
+        if match[group]:
+            event_type = group
+            break
+
+    return Event(
+        timestamp.decode(), event_type, log_file.name, line.decode("utf-8", "ignore")[:100]
+    )
+
 
-    lines = content.split("\n")
-    for line in lines[:500]:  # Sample first 500 lines
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, line)
-            if match:
-                # Classify event type
-                event_type = "info"
-                if re.search(r"(?i)error|exception|failed", line):
-                    event_type = "error"
-                elif re.search(r"(?i)start|begin|init", line):
-                    event_type = "start"
-                elif re.search(r"(?i)end|complete|finish|success", line):
-                    event_type = "end"
-                elif re.search(r"(?i)warning", line):
-                    event_type = "warning"
-
-                events.append({
-                    "timestamp": match.group(1),
-                    "type": event_type,
-                    "file": str(log_file.name),
-                    "content": line[:100],
-                })
-                break
-
-    return events
-
-
-def analyze_config(config_path: Path) -> list[dict]:
+def analyze_config(config_path: Path) -> list[Issue]:
     """Analyze pipeline config for issues."""
     issues = []
     content = config_path.read_text()
@@ -235,85 +488,139 @@ def analyze_config(config_path: Path) -> list[dict]:
 
     for pattern, severity, description in checks:
         if re.search(pattern, content):
-            issues.append({
-                "file": str(config_path),
-                "line": 0,
-                "severity": severity,
-                "description": description,
-                "content": "Config check",
-            })
+            issues.append(Issue(str(config_path), 0, severity, description, "Config check"))
 
     return issues
 
 
+def split_by_severity(issues: list[Issue]) -> tuple[list[Issue], list[Issue]]:
+    """Group issues into errors and warnings in a single pass."""
+    errors = []
+    warnings = []
+    for issue in issues:
+        if issue.severity == "error":
+            errors.append(issue)
+        elif issue.severity == "warning":
+            warnings.append(issue)
+    return errors, warnings
+
+
+_DIAGNOSIS_TEMPLATE = '''\
+# Pipeline Diagnosis Report
+
+Generated by skillpack pipeline-doctor on {timestamp}
+
+## Summary
+
+| Metric | Value |
+|--------|-------|
+| Errors | {error_count} |
+| Warnings | {warning_count} |
+| Unique patterns | {pattern_count} |
+| Timeline events | {event_count} |
+
+## Errors Found
+
+| File | Line | Description |
+|------|------|-------------|
+{error_rows}
+
+## Error Patterns
+
+| Pattern | Count |
+|---------|-------|
+{pattern_rows}
+
+## Timeline
+
+### First Events
+{first_event_rows}
+
+### Last Events
+{last_event_rows}
+
+## Health Indicators
+
+{critical}
+{warning}
+{healthy}
+'''
+
+
 def generate_diagnosis_report(
-    issues: list, patterns: list, timeline: list
+    errors: list[Issue], warnings: list[Issue], patterns: list, timeline: list[Event]
 ) -> str:
     """Generate diagnosis markdown report."""
-    
-    # Group issues by severity
-    errors = [i for i in issues if i["severity"] == "error"]
-    warnings = [i for i in issues if i["severity"] == "warning"]
 
     # Issue table
-    error_rows = "\n".join([
-        f"| {i['file'].split('/')[-1]} | {i['line']} | {i['description']} |"
-        for i in errors[:20]
-    ]) or "| No errors found |"
+    error_rows = "\n".join(
+        f"| {i.file.split('/')[-1]} | {i.line} | {i.description} |"
+        for i in islice(errors, 20)
+    ) or "| No errors found |"
 
     # Pattern table
-    pattern_rows = "\n".join([
+    pattern_rows = "\n".join(
         f"| {p['pattern']} | {p['count']} |"
-        for p in patterns[:10]
-    ]) or "| No patterns found |"
+        for p in islice(patterns, 10)
+    ) or "| No patterns found |"
 
     # Timeline (first/last events)
     first_events = timeline[:5]
     last_events = timeline[-5:] if len(timeline) > 5 else []
+    first_event_rows = "\n".join(
+        f"- `{e.timestamp}` [{e.type}] {e.content[:50]}..." for e in first_events
+    ) or "No events"
+    last_event_rows = "\n".join(
+        f"- `{e.timestamp}` [{e.type}] {e.content[:50]}..." for e in last_events
+    ) or "No events"
+
+    return _DIAGNOSIS_TEMPLATE.format(
+        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        error_count=len(errors),
+        warning_count=len(warnings),
+        pattern_count=len(patterns),
+        event_count=len(timeline),
+        error_rows=error_rows,
+        pattern_rows=pattern_rows,
+        first_event_rows=first_event_rows,
+        last_event_rows=last_event_rows,
+        critical="🔴 **Critical**: Multiple errors detected" if len(errors) > 10 else "",
+        warning="🟡 **Warning**: Some issues found" if len(warnings) > 5 else "",
+        healthy="🟢 **Healthy**: Few or no issues" if len(errors) == 0 and len(warnings) < 5 else "",
+    )
 
-    return dedent(f'''\
-        # Pipeline Diagnosis Report
-
-        Generated by skillpack pipeline-doctor on {datetime.now().strftime("%Y-%m-%d %H:%M")}
-
-        ## Summary
-
-        | Metric | Value |
-        |--------|-------|
-        | Errors | {len(errors)} |
-        | Warnings | {len(warnings)} |
-        | Unique patterns | {len(patterns)} |
-        | Timeline events | {len(timeline)} |
-
-        ## Errors Found
 
-        | File | Line | Description |
-        |------|------|-------------|
-{error_rows}
+_REMEDIATION_TEMPLATE = '''\
+# Remediation Suggestions
 
-        ## Error Patterns
+Generated by skillpack pipeline-doctor on {timestamp}
 
-        | Pattern | Count |
-        |---------|-------|
-{pattern_rows}
+## Recommended Actions
 
-        ## Timeline
+| Issue | Suggestion | Priority |
+|-------|------------|----------|
+{suggestion_rows}
 
-        ### First Events
-        {"".join([f"- `{e['timestamp']}` [{e['type']}] {e['content'][:50]}..." + chr(10) for e in first_events]) or "No events"}
+## General Best Practices
 
-        ### Last Events
-        {"".join([f"- `{e['timestamp']}` [{e['type']}] {e['content'][:50]}..." + chr(10) for e in last_events]) or "No events"}
+### Error Handling
+- Implement exponential backoff for retries
+- Add circuit breakers for external dependencies
+- Log structured errors with context
 
-        ## Health Indicators
+### Monitoring
+- Set up alerts for error rate thresholds
+- Monitor memory and CPU usage
+- Track pipeline latency percentiles
 
-        {"🔴 **Critical**: Multiple errors detected" if len(errors) > 10 else ""}
-        {"🟡 **Warning**: Some issues found" if len(warnings) > 5 else ""}
-        {"🟢 **Healthy**: Few or no issues" if len(errors) == 0 and len(warnings) < 5 else ""}
-    ''')
+### Recovery
+- Implement checkpointing for long-running jobs
+- Design for idempotent operations
+- Maintain dead-letter queues for failed records
+'''
 
 
-def generate_remediation(issues: list, patterns: list) -> str:
+def generate_remediation(issues: list[Issue], patterns: list) -> str:
     """Generate remediation suggestions."""
     
     suggestions = []
@@ -360,36 +667,12 @@ def generate_remediation(issues: list, patterns: list) -> str:
             seen.add(s["issue"])
             unique_suggestions.append(s)
 
-    suggestion_rows = "\n".join([
+    suggestion_rows = "\n".join(
         f"| {s['issue']} | {s['suggestion']} | {s['priority']} |"
         for s in unique_suggestions
-    ]) or "| No specific suggestions |"
-
-    return dedent(f'''\
-        # Remediation Suggestions
+    ) or "| No specific suggestions |"
 
-        Generated by skillpack pipeline-doctor on {datetime.now().strftime("%Y-%m-%d %H:%M")}
-
-        ## Recommended Actions
-
-        | Issue | Suggestion | Priority |
-        |-------|------------|----------|
-{suggestion_rows}
-
-        ## General Best Practices
-
-        ### Error Handling
-        - Implement exponential backoff for retries
-        - Add circuit breakers for external dependencies
-        - Log structured errors with context
-
-        ### Monitoring
-        - Set up alerts for error rate thresholds
-        - Monitor memory and CPU usage
-        - Track pipeline latency percentiles
-
-        ### Recovery
-        - Implement checkpointing for long-running jobs
-        - Design for idempotent operations
-        - Maintain dead-letter queues for failed records
-    ''')
+    return _REMEDIATION_TEMPLATE.format(
+        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        suggestion_rows=suggestion_rows,
+    )
@@ -1,7 +1,11 @@
 """PR Summary Skill - Generate PR summaries with risk assessment from diffs."""
 
 import argparse
+import io
+import os
 import re
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -11,6 +15,46 @@ from skillpack.utils.output import get_output_dir, write_text
 
 SKILL_NAME = "pr_summary"
 
+_BINARY_RE = re.compile(r"Binary files .+ and .+ differ$")
+
+# Header lines of a unified diff: git file header, old-file header, binary marker
+_HEADER_RE = re.compile(
+    r"^(?:diff --git a/(.*?) b/.*|--- (?:a/)?(.*?)|(Binary files .+ and .+ differ))\r?$",
+    re.MULTILINE,
+)
+
+# File name fragments that flag a change as sensitive
+_SENSITIVE_PATTERNS: dict[str, str] = {
+    ".sql": "Database schema changes",
+    ".env": "Environment configuration changes",
+    ".yml": "CI/CD or config changes",
+    ".yaml": "CI/CD or config changes",
+    "migration": "Database migration",
+}
+_SENSITIVE_RE = re.compile("|".join(re.escape(pattern) for pattern in _SENSITIVE_PATTERNS))
+
+# Static rollout/rollback guidance closing every summary
+_ROLLOUT_SECTION = """## Rollout Plan
+
+1. Merge to main branch
+2. Deploy to staging environment
+3. Run smoke tests
+4. Deploy to production
+
+## Rollback Plan
+
+1. Revert the merge commit: `git revert <commit-sha>`
+2. Push the revert
+3. Deploy the reverted code
+
+## Testing Checklist
+
+- [ ] Unit tests pass
+- [ ] Integration tests pass
+- [ ] Manual testing completed
+- [ ] Performance impact assessed
+"""
+
 
 @dataclass
 class DiffStats:
@@ -32,41 +76,83 @@ def parse_diff(diff_content: str) -> DiffStats:
     Returns:
         DiffStats with extracted information.
     """
-    files_changed: list[str] = []
-    binary_files: list[str] = []
+    # Content lines are tallied with C-level str.count (correcting for the
+    # +++/--- headers); only header lines need individual parsing.
+    insertions = diff_content.count("\n+") - diff_content.count("\n+++")
+    deletions = diff_content.count("\n-") - diff_content.count("\n---")
+    if diff_content.startswith("+") and not diff_content.startswith("+++"):
+        insertions += 1
+    elif diff_content.startswith("-") and not diff_content.startswith("---"):
+        deletions += 1
+
+    filenames = []
+    binary_count = 0
+    for match in _HEADER_RE.finditer(diff_content):
+        if match.group(3):
+            binary_count += 1
+        else:
+            filenames.append(match.group(1) or match.group(2))
+
+    return _build_stats(filenames, insertions, deletions, binary_count)
+
+
+def parse_diff_lines(lines: Iterable[str]) -> DiffStats:
+    """Parse a unified diff line by line and extract statistics.
+
+    Args:
+        lines: Lines of the diff, with or without trailing newlines
+            (e.g. an open file).
+
+    Returns:
+        DiffStats with extracted information.
+    """
+    filenames = []
+    binary_count = 0
     insertions = 0
     deletions = 0
-    file_types: dict[str, int] = {}
 
-    # Match file headers in unified diff format
-    file_pattern = re.compile(r"^(?:diff --git a/(.+?) b/|--- a/(.+)|--- (.+))$", re.MULTILINE)
-    binary_pattern = re.compile(r"^Binary files .+ and .+ differ$", re.MULTILINE)
+    # Single pass, checking the common +/- content lines first
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.startswith("+"):
+            if not line.startswith("+++"):
+                insertions += 1
+        elif line.startswith("-"):
+            if not line.startswith("---"):
+                deletions += 1
+            elif line.startswith("--- "):
+                filename = line[4:]
+                filenames.append(filename[2:] if filename.startswith("a/") else filename)
+        elif line.startswith("diff --git a/"):
+            filenames.append(line[len("diff --git a/"):].split(" b/", 1)[0])
+        elif line.startswith("Binary files ") and _BINARY_RE.match(line):
+            binary_count += 1
+
+    return _build_stats(filenames, insertions, deletions, binary_count)
+
+
+def _build_stats(
+    filenames: Iterable[str], insertions: int, deletions: int, binary_count: int
+) -> DiffStats:
+    """Assemble DiffStats from the file names seen in diff headers."""
+    files_changed: list[str] = []
+    file_types: Counter[str] = Counter()
+    seen: set[str] = set()
 
-    for match in file_pattern.finditer(diff_content):
-        filename = match.group(1) or match.group(2) or match.group(3)
-        if filename and filename not in files_changed and not filename.startswith("/dev/null"):
+    for filename in filenames:
+        if filename and filename not in seen and not filename.startswith("/dev/null"):
+            seen.add(filename)
             files_changed.append(filename)
 
-            # Track file types
-            ext = Path(filename).suffix.lower() or "(no ext)"
-            file_types[ext] = file_types.get(ext, 0) + 1
-
-    for match in binary_pattern.finditer(diff_content):
-        # Extract binary file names if needed
-        binary_files.append("(binary)")
-
-    # Count insertions and deletions
-    for line in diff_content.split("\n"):
-        if line.startswith("+") and not line.startswith("+++"):
-            insertions += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            deletions += 1
+            # Track file types (a bare trailing "." is not an extension, as with Path.suffix)
+            ext = os.path.splitext(filename)[1].lower()
+            file_types[ext if len(ext) > 1 else "(no ext)"] += 1
 
     return DiffStats(
         files_changed=sorted(files_changed),
         insertions=insertions,
         deletions=deletions,
-        binary_files=binary_files,
+        binary_files=["(binary)"] * binary_count,
         file_types=dict(sorted(file_types.items())),
     )
 
@@ -100,21 +186,17 @@ def assess_risk(stats: DiffStats) -> tuple[str, list[str]]:
         risk_factors.append(f"Multiple files changed: {len(stats.files_changed)}")
         risk_score += 1
 
-    # Sensitive file types
-    sensitive_patterns = {
-        ".sql": "Database schema changes",
-        ".env": "Environment configuration changes",
-        ".yml": "CI/CD or config changes",
-        ".yaml": "CI/CD or config changes",
-        "migration": "Database migration",
-    }
-
-    for pattern, description in sensitive_patterns.items():
-        for filename in stats.files_changed:
-            if pattern in filename.lower():
-                risk_factors.append(description)
-                risk_score += 1
-                break
+    # Sensitive file types: one scan per file name, stopping once all are found
+    found: set[str] = set()
+    for filename in stats.files_changed:
+        found.update(_SENSITIVE_RE.findall(filename.lower()))
+        if len(found) == len(_SENSITIVE_PATTERNS):
+            break
+
+    for pattern, description in _SENSITIVE_PATTERNS.items():
+        if pattern in found:
+            risk_factors.append(description)
+            risk_score += 1
 
     # Determine risk level
     if risk_score >= 4:
@@ -140,74 +222,56 @@ def generate_summary(
     Returns:
         Markdown content for the PR summary.
     """
-    stats = parse_diff(diff_content)
+    return format_summary(parse_diff(diff_content), title)
+
+
+def format_summary(stats: DiffStats, title: str = "Pull Request Summary") -> str:
+    """Render diff statistics as a PR summary markdown document.
+
+    Args:
+        stats: Diff statistics.
+        title: Title for the summary.
+
+    Returns:
+        Markdown content for the PR summary.
+    """
     risk_level, risk_factors = assess_risk(stats)
 
+    buf = io.StringIO()
+    w = buf.write
+
     # Build the summary
-    lines = [
-        f"# {title}",
-        "",
-        "## Overview",
-        "",
-        f"- **Files Changed:** {len(stats.files_changed)}",
-        f"- **Lines Added:** +{stats.insertions}",
-        f"- **Lines Removed:** -{stats.deletions}",
-        "",
-        "## Risk Assessment",
-        "",
-        f"**Risk Level:** {risk_level}",
-        "",
-    ]
+    w(f"# {title}\n\n## Overview\n\n")
+    w(f"- **Files Changed:** {len(stats.files_changed)}\n")
+    w(f"- **Lines Added:** +{stats.insertions}\n")
+    w(f"- **Lines Removed:** -{stats.deletions}\n")
+    w(f"\n## Risk Assessment\n\n**Risk Level:** {risk_level}\n\n")
 
     if risk_factors:
-        lines.append("### Risk Factors")
-        lines.append("")
+        w("### Risk Factors\n\n")
         for factor in risk_factors:
-            lines.append(f"- {factor}")
-        lines.append("")
+            w(f"- {factor}\n")
+        w("\n")
 
     # File types breakdown
     if stats.file_types:
-        lines.append("## File Types Changed")
-        lines.append("")
+        w("## File Types Changed\n\n")
         for ext, count in stats.file_types.items():
-            lines.append(f"- `{ext}`: {count} file(s)")
-        lines.append("")
+            w(f"- `{ext}`: {count} file(s)\n")
+        w("\n")
 
     # Files list
-    lines.append("## Files Changed")
-    lines.append("")
+    w("## Files Changed\n\n")
     for filename in stats.files_changed[:50]:  # Limit to 50 files
-        lines.append(f"- `{filename}`")
+        w(f"- `{filename}`\n")
     if len(stats.files_changed) > 50:
-        lines.append(f"- ... and {len(stats.files_changed) - 50} more files")
-    lines.append("")
+        w(f"- ... and {len(stats.files_changed) - 50} more files\n")
+    w("\n")
 
     # Rollout/Rollback guidance
-    lines.extend([
-        "## Rollout Plan",
-        "",
-        "1. Merge to main branch",
-        "2. Deploy to staging environment",
-        "3. Run smoke tests",
-        "4. Deploy to production",
-        "",
-        "## Rollback Plan",
-        "",
-        "1. Revert the merge commit: `git revert <commit-sha>`",
-        "2. Push the revert",
-        "3. Deploy the reverted code",
-        "",
-        "## Testing Checklist",
-        "",
-        "- [ ] Unit tests pass",
-        "- [ ] Integration tests pass",
-        "- [ ] Manual testing completed",
-        "- [ ] Performance impact assessed",
-        "",
-    ])
-
-    return "\n".join(lines)
+    w(_ROLLOUT_SECTION)
+
+    return buf.getvalue()
 
 
 def generate_pr_summary(
@@ -233,14 +297,17 @@ def generate_pr_summary(
         diff_path = Path(diff_file)
         if not diff_path.exists():
             raise FileNotFoundError(f"Diff file not found: {diff_file}")
-        content = diff_path.read_text(encoding="utf-8")
+        logger.info("Generating PR summary...")
+        # Stream the file rather than reading it into memory
+        with diff_path.open(encoding="utf-8") as f:
+            stats = parse_diff_lines(f)
     elif diff_content:
-        content = diff_content
+        logger.info("Generating PR summary...")
+        stats = parse_diff(diff_content)
     else:
         raise ValueError("Either diff_file or diff_content must be provided")
 
-    logger.info("Generating PR summary...")
-    summary = generate_summary(content, title)
+    summary = format_summary(stats, title)
 
     output_dir = get_output_dir(SKILL_NAME, base_dir)
     output_path = output_dir / "PR_SUMMARY.md"
@@ -2,19 +2,62 @@
 
 import argparse
 import csv
-import json
+import io
+import os
+import random
+import re
 import statistics
+import warnings
+from array import array
 from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from skillpack.utils.logging import get_logger
-from skillpack.utils.output import get_output_dir
+from skillpack.utils.output import dumps_json, get_output_dir
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # pragma: no cover - fall back to the statistics module
+    _HAS_NUMPY = False
+
+try:
+    import pandas as pd
+
+    _HAS_PANDAS = True
+except ImportError:  # pragma: no cover - fall back to the csv module
+    _HAS_PANDAS = False
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HAS_PYARROW = False
 
 SKILL_NAME = "profile_dataset"
 
+_BOOL_VALUES = frozenset({"true", "false", "yes", "no", "1", "0", "t", "f", "y", "n"})
+_INT_RE = re.compile(r"\s*[-+]?\d+(?:_\d+)*\s*")
+
+# Distinct values tracked per column before it is reported as high-cardinality
+_UNIQUE_LIMIT = 10_000
+_SAMPLE_VALUE_COUNT = 5
+
+# Fixed seed so repeated sampled profiles of the same file agree
+_SAMPLE_SEED = 0
+
+# Spread columns across processes only for wide, large tables
+_PARALLEL_MIN_COLUMNS = 8
+_PARALLEL_MIN_CELLS = 1_000_000
+
 
 @dataclass
 class ColumnProfile:
@@ -36,6 +79,8 @@ class ColumnProfile:
     min_length: int | None = None
     max_length: int | None = None
     avg_length: float | None = None
+    # True when unique_count stopped at _UNIQUE_LIMIT (high-cardinality column)
+    unique_capped: bool = False
 
 
 @dataclass
@@ -47,46 +92,66 @@ class DatasetProfile:
     row_count: int
     column_count: int
     columns: list[ColumnProfile] = field(default_factory=list)
+    # Rows the column statistics were computed from, when only a sample was profiled
+    sampled_rows: int | None = None
     profiled_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-def infer_dtype(values: list[str]) -> str:
+def infer_dtype(values: Iterable[str]) -> str:
     """Infer the data type from a list of string values.
 
+    All candidate types are checked in a single pass that stops as soon as
+    the values can only be strings.
+
     Args:
         values: List of string values.
 
     Returns:
         Inferred type: 'integer', 'float', 'boolean', or 'string'.
     """
-    non_empty = [v for v in values if v.strip()]
-    if not non_empty:
+    is_bool = is_int = is_float = True
+    seen = False
+
+    for v in values:
+        if not v.strip():
+            continue
+        seen = True
+
+        if is_bool and v.lower() not in _BOOL_VALUES:
+            is_bool = False
+        if is_int and not _INT_RE.fullmatch(v):
+            is_int = False
+        if is_float and not is_int:
+            try:
+                float(v)
+            except ValueError:
+                is_float = False
+
+        if not (is_bool or is_float):
+            return "string"
+
+    if not seen:
         return "string"
-
-    # Check for boolean
-    bool_values = {"true", "false", "yes", "no", "1", "0", "t", "f", "y", "n"}
-    if all(v.lower() in bool_values for v in non_empty):
+    if is_bool:
         return "boolean"
-
-    # Check for integer
-    try:
-        for v in non_empty:
-            int(v)
+    if is_int:
         return "integer"
-    except ValueError:
-        pass
-
-    # Check for float
-    try:
-        for v in non_empty:
-            float(v)
+    if is_float:
         return "float"
-    except ValueError:
-        pass
-
     return "string"
 
 
+def _set_numeric_stats(profile: ColumnProfile, arr: "np.ndarray") -> None:
+    """Fill in the numeric statistics from a float64 array; median uses a partial sort."""
+    with np.errstate(invalid="ignore"):
+        profile.min_value = float(arr.min())
+        profile.max_value = float(arr.max())
+        profile.mean_value = float(arr.mean())
+        profile.median_value = float(np.median(arr))
+        if arr.size > 1:
+            profile.std_dev = float(arr.std(ddof=1))
+
+
 def profile_column(name: str, values: list[str]) -> ColumnProfile:
     """Profile a single column.
 
@@ -98,12 +163,40 @@ def profile_column(name: str, values: list[str]) -> ColumnProfile:
         ColumnProfile with statistics.
     """
     total_count = len(values)
-    null_count = sum(1 for v in values if not v.strip())
-    non_null_values = [v for v in values if v.strip()]
-    unique_count = len(set(non_null_values))
-
-    # Get sample values (up to 5 unique values)
-    sample_values = list(set(non_null_values))[:5]
+    non_null_values: list[str] = []
+    unique_values: set[str] = set()
+    sample_values: list[str] = []
+    numeric_values: array | None = array("d")
+    total_length = 0
+    min_length = max_length = -1
+
+    # Single pass: nulls, uniques, lengths and numeric parsing together
+    for v in values:
+        if not v.strip():
+            continue
+        non_null_values.append(v)
+
+        # ID-like columns stop growing the set once past the limit
+        if len(unique_values) <= _UNIQUE_LIMIT:
+            if len(sample_values) < _SAMPLE_VALUE_COUNT and v not in unique_values:
+                sample_values.append(v)
+            unique_values.add(v)
+
+        length = len(v)
+        total_length += length
+        if min_length < 0 or length < min_length:
+            min_length = length
+        if length > max_length:
+            max_length = length
+
+        if numeric_values is not None:
+            try:
+                numeric_values.append(float(v))
+            except ValueError:
+                numeric_values = None
+
+    null_count = total_count - len(non_null_values)
+    unique_capped = len(unique_values) > _UNIQUE_LIMIT
 
     dtype = infer_dtype(non_null_values)
 
@@ -112,51 +205,149 @@ def profile_column(name: str, values: list[str]) -> ColumnProfile:
         dtype=dtype,
         total_count=total_count,
         null_count=null_count,
-        unique_count=unique_count,
+        unique_count=min(len(unique_values), _UNIQUE_LIMIT),
         sample_values=sorted(sample_values),
+        unique_capped=unique_capped,
     )
 
     # Compute numeric stats
-    if dtype in ("integer", "float") and non_null_values:
+    if dtype in ("integer", "float") and numeric_values and _HAS_NUMPY:
+        # Zero-copy view of the parsed doubles
+        _set_numeric_stats(profile, np.frombuffer(numeric_values, dtype=np.float64))
+    elif dtype in ("integer", "float") and numeric_values:
         try:
-            numeric_values = [float(v) for v in non_null_values]
             profile.min_value = min(numeric_values)
             profile.max_value = max(numeric_values)
             profile.mean_value = statistics.mean(numeric_values)
             profile.median_value = statistics.median(numeric_values)
             if len(numeric_values) > 1:
                 profile.std_dev = statistics.stdev(numeric_values)
-        except (ValueError, statistics.StatisticsError):
+        except statistics.StatisticsError:
             pass
 
     # Compute string stats
     if dtype == "string" and non_null_values:
-        lengths = [len(v) for v in non_null_values]
-        profile.min_length = min(lengths)
-        profile.max_length = max(lengths)
-        profile.avg_length = statistics.mean(lengths)
+        profile.min_length = min_length
+        profile.max_length = max_length
+        profile.avg_length = total_length / len(non_null_values)
 
     return profile
 
 
-def profile_csv(csv_path: str | Path) -> DatasetProfile:
-    """Profile a CSV file.
+def profile_series(name: str, series: "pd.Series") -> ColumnProfile:
+    """Profile a single column held as a pandas Series of strings.
+
+    Mirrors profile_column, using vectorized pandas operations for the null
+    filter, uniques and lengths. The dtype comes from infer_dtype and the
+    numeric statistics from the same float() parse and NumPy reductions as
+    profile_column, so every reader reports the same profile for a column.
 
     Args:
-        csv_path: Path to the CSV file.
+        name: Column name.
+        series: Column values, read as strings with empty cells as "".
 
     Returns:
-        DatasetProfile with all column profiles.
+        ColumnProfile with statistics.
     """
-    logger = get_logger()
-    csv_path = Path(csv_path)
+    non_null = series[series.str.strip() != ""]
+    unique_values = non_null.unique()
+    values = non_null.tolist()
+    dtype = infer_dtype(values)
 
-    if not csv_path.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    profile = ColumnProfile(
+        name=name,
+        dtype=dtype,
+        total_count=len(series),
+        null_count=len(series) - len(non_null),
+        unique_count=min(len(unique_values), _UNIQUE_LIMIT),
+        sample_values=sorted(unique_values[:_SAMPLE_VALUE_COUNT].tolist()),
+        unique_capped=len(unique_values) > _UNIQUE_LIMIT,
+    )
+
+    # Compute numeric stats
+    if dtype in ("integer", "float") and values:
+        numeric = np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+        _set_numeric_stats(profile, numeric)
+
+    # Compute string stats
+    if dtype == "string" and not non_null.empty:
+        lengths = non_null.str.len()
+        profile.min_length = int(lengths.min())
+        profile.max_length = int(lengths.max())
+        profile.avg_length = float(lengths.mean())
+
+    return profile
+
+
+def _profile_columns(
+    profile_fn: Callable[[str, Any], ColumnProfile],
+    names: Sequence[str],
+    columns: Sequence[Any],
+    row_count: int,
+) -> list[ColumnProfile]:
+    """Profile every column, in a process pool when the table is big enough to pay for it."""
+    if len(names) >= _PARALLEL_MIN_COLUMNS and len(names) * row_count >= _PARALLEL_MIN_CELLS:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(profile_fn, names, columns))
+    return [profile_fn(name, column) for name, column in zip(names, columns, strict=True)]
+
+
+def _read_with_arrow(csv_path: Path, headers: list[str]) -> "pd.DataFrame":
+    """Parse a CSV with Arrow's multithreaded reader, keeping every column as text."""
+    table = pacsv.read_csv(
+        csv_path,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types=dict.fromkeys(headers, pa.string()),
+            strings_can_be_null=False,
+        ),
+    )
+    df: pd.DataFrame = table.to_pandas()
+    return df
 
-    logger.info(f"Profiling: {csv_path}")
 
-    # Read CSV
+def _profile_with_pandas(csv_path: Path) -> tuple[int, list[ColumnProfile]]:
+    """Read a CSV into columnar storage and profile each column.
+
+    Parsing goes through pyarrow when it is installed and through pandas'
+    own C parser otherwise.
+    """
+    # utf-8-sig: both parsers drop a leading BOM from the first column name,
+    # so the Arrow column_types keys must not keep it either
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        headers = next(csv.reader(f), None)
+    if not headers:
+        raise ValueError("CSV file has no headers")
+
+    df = None
+    if _HAS_PYARROW and len(set(headers)) == len(headers):
+        try:
+            df = _read_with_arrow(csv_path, headers)
+        except pa.ArrowInvalid:
+            # Ragged rows and the like: let pandas' more forgiving parser handle them
+            df = None
+    if df is None:
+        try:
+            # index_col=False: when every row has extra fields, pandas would otherwise
+            # move the first field into the index and shift each column by one. The
+            # extras are dropped instead, as the csv module does, without a warning.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", pd.errors.ParserWarning)
+                df = pd.read_csv(
+                    csv_path, dtype=str, keep_default_na=False, encoding="utf-8", index_col=False
+                )
+        except pd.errors.ParserError:
+            # Rows with more fields than the header; the csv module ignores the extras
+            return _profile_with_csv(csv_path)
+
+    df = df.fillna("")
+    names = [str(h) for h in df.columns]
+    series = [df[h] for h in df.columns]
+    return len(df), _profile_columns(profile_series, names, series, len(df))
+
+
+def _profile_with_csv(csv_path: Path) -> tuple[int, list[ColumnProfile]]:
+    """Read a CSV with the stdlib csv module and profile each column."""
     with open(csv_path, encoding="utf-8", newline="") as f:
         reader = csv.DictReader(f)
         if reader.fieldnames is None:
@@ -169,17 +360,98 @@ def profile_csv(csv_path: str | Path) -> DatasetProfile:
     column_values: dict[str, list[str]] = {h: [] for h in headers}
     for row in rows:
         for h in headers:
-            column_values[h].append(row.get(h, ""))
+            column_values[h].append(row.get(h) or "")
+
+    values = [column_values[h] for h in headers]
+    return len(rows), _profile_columns(profile_column, headers, values, len(rows))
 
-    # Profile each column
-    columns = [profile_column(h, column_values[h]) for h in headers]
+
+def _profile_sampled(
+    csv_path: Path, sample_size: int
+) -> tuple[int, list[ColumnProfile], int | None]:
+    """Stream a CSV, reservoir-sampling rows, and profile the sample.
+
+    Uses Algorithm R so memory stays bounded by sample_size however large
+    the file is; the row count still covers every row.
+
+    Returns:
+        Tuple of (row_count, columns, sampled_rows), where sampled_rows is
+        None when the whole file fit in the sample.
+    """
+    rng = random.Random(_SAMPLE_SEED)
+    reservoir: list[list[str]] = []
+    row_count = 0
+
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        while headers == []:
+            headers = next(reader, None)
+        if headers is None:
+            raise ValueError("CSV file has no headers")
+
+        for row in reader:
+            if not row:
+                continue
+            row_count += 1
+            if len(reservoir) < sample_size:
+                reservoir.append(row)
+            else:
+                slot = rng.randrange(row_count)
+                if slot < sample_size:
+                    reservoir[slot] = row
+
+    # Collect values per column, padding short rows like DictReader does
+    width = len(headers)
+    values: list[list[str]] = [[] for _ in headers]
+    for row in reservoir:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        for column, value in zip(values, row, strict=False):
+            column.append(value)
+
+    columns = _profile_columns(profile_column, headers, values, len(reservoir))
+    sampled_rows = len(reservoir) if row_count > sample_size else None
+    return row_count, columns, sampled_rows
+
+
+def profile_csv(csv_path: str | Path, sample_size: int | None = None) -> DatasetProfile:
+    """Profile a CSV file.
+
+    Args:
+        csv_path: Path to the CSV file.
+        sample_size: If given, profile a uniform random sample of at most this
+            many rows instead of the whole file. Column statistics are then
+            estimates; the row count is still exact.
+
+    Returns:
+        DatasetProfile with all column profiles.
+    """
+    logger = get_logger()
+    csv_path = Path(csv_path)
+
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    logger.info(f"Profiling: {csv_path}")
+
+    sampled_rows = None
+    if sample_size is not None:
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be positive, got {sample_size}")
+        row_count, columns, sampled_rows = _profile_sampled(csv_path, sample_size)
+    elif _HAS_PANDAS:
+        row_count, columns = _profile_with_pandas(csv_path)
+    else:
+        row_count, columns = _profile_with_csv(csv_path)
 
     return DatasetProfile(
         file_path=str(csv_path.absolute()),
         file_size_bytes=csv_path.stat().st_size,
-        row_count=len(rows),
-        column_count=len(headers),
+        row_count=row_count,
+        column_count=len(columns),
         columns=columns,
+        sampled_rows=sampled_rows,
     )
 
 
@@ -197,6 +469,7 @@ def profile_to_dict(profile: DatasetProfile) -> dict[str, Any]:
         "file_size_bytes": profile.file_size_bytes,
         "row_count": profile.row_count,
         "column_count": profile.column_count,
+        "sampled_rows": profile.sampled_rows,
         "profiled_at": profile.profiled_at,
         "columns": [
             {
@@ -206,6 +479,7 @@ def profile_to_dict(profile: DatasetProfile) -> dict[str, Any]:
                 "null_count": col.null_count,
                 "null_rate": round(col.null_count / col.total_count, 4) if col.total_count else 0,
                 "unique_count": col.unique_count,
+                "unique_count_capped": col.unique_capped,
                 "sample_values": col.sample_values,
                 "min_value": col.min_value,
                 "max_value": col.max_value,
@@ -230,70 +504,65 @@ def profile_to_markdown(profile: DatasetProfile) -> str:
     Returns:
         Markdown representation of the profile.
     """
-    lines = [
-        "# Dataset Profile",
-        "",
-        "## Overview",
-        "",
-        f"- **File:** `{profile.file_path}`",
-        f"- **Size:** {profile.file_size_bytes:,} bytes",
-        f"- **Rows:** {profile.row_count:,}",
-        f"- **Columns:** {profile.column_count}",
-        f"- **Profiled at:** {profile.profiled_at}",
-        "",
-        "## Columns",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+
+    w("# Dataset Profile\n\n## Overview\n\n")
+    w(f"- **File:** `{profile.file_path}`\n")
+    w(f"- **Size:** {profile.file_size_bytes:,} bytes\n")
+    w(f"- **Rows:** {profile.row_count:,}\n")
+    w(f"- **Columns:** {profile.column_count}\n")
+    w(f"- **Profiled at:** {profile.profiled_at}\n")
+    if profile.sampled_rows is not None:
+        w(f"- **Sampled:** {profile.sampled_rows:,} rows (column statistics are estimates)\n")
+    w("\n## Columns\n")
 
     for col in profile.columns:
         null_rate = (col.null_count / col.total_count * 100) if col.total_count else 0
-        lines.extend([
-            f"### {col.name}",
-            "",
-            f"- **Type:** {col.dtype}",
-            f"- **Null Count:** {col.null_count} ({null_rate:.1f}%)",
-            f"- **Unique Values:** {col.unique_count}",
-        ])
+        w(f"\n### {col.name}\n\n")
+        w(f"- **Type:** {col.dtype}\n")
+        w(f"- **Null Count:** {col.null_count} ({null_rate:.1f}%)\n")
+        w(f"- **Unique Values:** {'> ' if col.unique_capped else ''}{col.unique_count}\n")
 
         if col.dtype in ("integer", "float"):
-            lines.append(f"- **Range:** [{col.min_value}, {col.max_value}]")
+            w(f"- **Range:** [{col.min_value}, {col.max_value}]\n")
             if col.mean_value is not None:
-                lines.append(f"- **Mean:** {col.mean_value:.4f}")
+                w(f"- **Mean:** {col.mean_value:.4f}\n")
             if col.median_value is not None:
-                lines.append(f"- **Median:** {col.median_value}")
+                w(f"- **Median:** {col.median_value}\n")
             if col.std_dev is not None:
-                lines.append(f"- **Std Dev:** {col.std_dev:.4f}")
+                w(f"- **Std Dev:** {col.std_dev:.4f}\n")
 
         if col.dtype == "string" and col.min_length is not None:
-            lines.append(f"- **Length Range:** [{col.min_length}, {col.max_length}]")
+            w(f"- **Length Range:** [{col.min_length}, {col.max_length}]\n")
             if col.avg_length is not None:
-                lines.append(f"- **Avg Length:** {col.avg_length:.2f}")
+                w(f"- **Avg Length:** {col.avg_length:.2f}\n")
 
         if col.sample_values:
             samples = ", ".join(f"`{v}`" for v in col.sample_values[:5])
-            lines.append(f"- **Sample Values:** {samples}")
+            w(f"- **Sample Values:** {samples}\n")
 
-        lines.append("")
-
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_profile(
     csv_path: str,
     base_dir: str = "./out",
+    sample_size: int | None = None,
 ) -> tuple[Path, Path]:
     """Generate profile outputs for a CSV file.
 
     Args:
         csv_path: Path to the CSV file.
         base_dir: Base output directory.
+        sample_size: Profile at most this many randomly sampled rows.
 
     Returns:
         Tuple of (markdown_path, json_path).
     """
     logger = get_logger()
 
-    profile = profile_csv(csv_path)
+    profile = profile_csv(csv_path, sample_size=sample_size)
     profile_dict = profile_to_dict(profile)
     profile_md = profile_to_markdown(profile)
 
@@ -301,10 +570,7 @@ def generate_profile(
 
     # Write JSON
     json_path = output_dir / "profile.json"
-    json_path.write_text(
-        json.dumps(profile_dict, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    json_path.write_text(dumps_json(profile_dict), encoding="utf-8")
     logger.info(f"JSON profile: {json_path}")
 
     # Write Markdown
@@ -318,7 +584,7 @@ def generate_profile(
 def handler(args: argparse.Namespace) -> int:
     """Handle the profile-dataset command."""
     try:
-        md_path, json_path = generate_profile(csv_path=args.csv)
+        md_path, json_path = generate_profile(csv_path=args.csv, sample_size=args.sample_size)
         print(f"✅ Profile generated:")
         print(f"   Markdown: {md_path}")
         print(f"   JSON: {json_path}")
@@ -340,4 +606,10 @@ def register_parser(subparsers: Any) -> None:
         required=True,
         help="Path to the CSV file to profile",
     )
+    parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=None,
+        help="Profile a random sample of at most this many rows (for very large files)",
+    )
     parser.set_defaults(handler=handler)
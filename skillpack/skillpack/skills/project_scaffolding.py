@@ -149,6 +149,15 @@ jobs:
 ''',
 }
 
+# Sorted once; templates without braces are written as-is, skipping str.format
+_TEMPLATES_COMPILED: list[tuple[str, str, bool]] = [
+    (file_path, template, "{" in template or "}" in template)
+    for file_path, template in sorted(TEMPLATES.items())
+]
+
+# Distinct directories the templates live in, relative to the project root
+_TEMPLATE_DIRS: list[Path] = sorted({Path(file_path).parent for file_path in TEMPLATES})
+
 
 def generate_project(
     name: str,
@@ -171,12 +180,14 @@ def generate_project(
 
     logger.info(f"Generating project skeleton: {name}")
 
-    for file_path, template in sorted(TEMPLATES.items()):
-        content = template.format(name=name, description=description)
+    # Create each nested directory once instead of once per file
+    for directory in _TEMPLATE_DIRS:
+        (project_dir / directory).mkdir(parents=True, exist_ok=True)
+
+    for file_path, template, needs_format in _TEMPLATES_COMPILED:
+        content = template.format(name=name, description=description) if needs_format else template
 
-        # Handle nested directories
         full_path = project_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
         full_path.write_text(content, encoding="utf-8")
         logger.debug(f"  Created: {file_path}")
 
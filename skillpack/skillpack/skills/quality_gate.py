@@ -1,37 +1,175 @@
 """Quality Gate Skill - Run format + lint + type-check + tests."""
 
 import argparse
+import asyncio
+import codecs
 import subprocess
 import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, TextIO
 
 from skillpack.utils.logging import get_logger
 
 SKILL_NAME = "quality_gate"
 
+# Lines of streamed output kept for the caller once a command finishes
+_OUTPUT_TAIL_LINES = 200
 
-def run_command(cmd: list[str], check: bool = False) -> tuple[int, str, str]:
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _tee(pipe: IO[str], sink: TextIO, tail: deque[str]) -> None:
+    """Copy lines from a child's pipe to a stream as they arrive, keeping the last few."""
+    for line in pipe:
+        sink.write(line)
+        sink.flush()
+        tail.append(line)
+    pipe.close()
+
+
+def run_command(cmd: list[str], check: bool = False, stream: bool = False) -> tuple[int, str, str]:
     """Run a command and return exit code, stdout, stderr.
 
     Args:
         cmd: Command and arguments to run.
         check: If True, only check without fixing.
+        stream: If True, echo output line by line while the command runs and
+            return only the last _OUTPUT_TAIL_LINES lines of each stream.
 
     Returns:
         Tuple of (exit_code, stdout, stderr).
     """
     try:
-        result = subprocess.run(
+        if not stream:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=Path.cwd(),
+            )
+            return result.returncode, result.stdout, result.stderr
+
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=Path.cwd(),
         )
-        return result.returncode, result.stdout, result.stderr
     except FileNotFoundError:
         return 1, "", f"Command not found: {cmd[0]}"
 
+    stdout_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_tee, args=(process.stdout, sys.stdout, stdout_tail)),
+        threading.Thread(target=_tee, args=(process.stderr, sys.stderr, stderr_tail)),
+    ]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+
+    return process.wait(), "".join(stdout_tail), "".join(stderr_tail)
+
+
+async def _tee_async(reader: asyncio.StreamReader, sink: TextIO, tail: deque[str]) -> None:
+    """Async counterpart of _tee for asyncio subprocess pipes.
+
+    Reads in chunks rather than lines, since StreamReader.readline() fails on
+    lines longer than the stream's buffer limit.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending: list[str] = []
+    while chunk := await reader.read(_READ_CHUNK_SIZE):
+        text = decoder.decode(chunk)
+        sink.write(text)
+        sink.flush()
+        *lines, rest = text.split("\n")
+        if lines:
+            lines[0] = "".join(pending) + lines[0]
+            pending.clear()
+            tail.extend(line + "\n" for line in lines)
+        if rest:
+            pending.append(rest)
+    rest = decoder.decode(b"", final=True)
+    if rest:
+        sink.write(rest)
+        pending.append(rest)
+    if pending:
+        tail.append("".join(pending))
+
+
+async def run_command_async(cmd: list[str], stream: bool = False) -> tuple[int, str, str]:
+    """Run a command without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments to run.
+        stream: If True, echo output line by line while the command runs and
+            return only the last _OUTPUT_TAIL_LINES lines of each stream.
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr).
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=Path.cwd(),
+        )
+    except FileNotFoundError:
+        return 1, "", f"Command not found: {cmd[0]}"
+
+    if not stream:
+        stdout, stderr = await process.communicate()
+        return (
+            process.returncode or 0,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
+    assert process.stdout is not None and process.stderr is not None
+    stdout_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    await asyncio.gather(
+        _tee_async(process.stdout, sys.stdout, stdout_tail),
+        _tee_async(process.stderr, sys.stderr, stderr_tail),
+    )
+    return await process.wait(), "".join(stdout_tail), "".join(stderr_tail)
+
+
+async def _run_concurrently(
+    cmds: list[list[str]], stream: list[bool] | None = None
+) -> list[tuple[int, str, str]]:
+    """Run independent commands at the same time, returning results in order."""
+    stream = stream or [False] * len(cmds)
+    return list(
+        await asyncio.gather(
+            *(run_command_async(cmd, s) for cmd, s in zip(cmds, stream, strict=True))
+        )
+    )
+
+
+def _print_output(stdout: str, stderr: str) -> None:
+    """Print output that was captured rather than streamed."""
+    if stdout:
+        print(stdout)
+    if stderr:
+        print(stderr, file=sys.stderr)
+
+
+def _report_step(name: str, code: int) -> None:
+    """Log whether a step passed."""
+    logger = get_logger()
+
+    if code != 0:
+        logger.error(f"❌ {name} failed with exit code {code}")
+    else:
+        logger.info(f"✅ {name} passed")
+
 
 def run_quality_gate(check_only: bool = False) -> int:
     """Run the full quality gate.
@@ -45,28 +183,39 @@ def run_quality_gate(check_only: bool = False) -> int:
     logger = get_logger()
     exit_code = 0
 
-    steps = [
+    # Format and lint rewrite files, so they run one after the other
+    sequential_steps = [
         ("Format", ["ruff", "format"] + (["--check"] if check_only else []) + ["."]),
         ("Lint", ["ruff", "check"] + ([] if check_only else ["--fix"]) + ["."]),
-        ("Type Check", ["mypy", "skillpack/"]),
-        ("Tests", ["pytest", "tests/", "-v"]),
+    ]
+    # Type checking and tests only read files and can overlap. Only the test
+    # run streams live; mypy's report is printed once both have finished.
+    concurrent_steps = [
+        ("Type Check", ["mypy", "skillpack/"], False),
+        ("Tests", ["pytest", "tests/", "-v"], True),
     ]
 
-    for name, cmd in steps:
+    for name, cmd in sequential_steps:
         logger.info(f"Running: {name}")
-        code, stdout, stderr = run_command(cmd)
-
-        if stdout:
-            print(stdout)
-        if stderr:
-            print(stderr, file=sys.stderr)
-
+        code, _, _ = run_command(cmd, stream=True)
+        _report_step(name, code)
         if code != 0:
-            logger.error(f"❌ {name} failed with exit code {code}")
             exit_code = code
             # Continue running other checks even if one fails
-        else:
-            logger.info(f"✅ {name} passed")
+
+    logger.info(f"Running: {', '.join(name for name, _, _ in concurrent_steps)}")
+    results = asyncio.run(
+        _run_concurrently(
+            [cmd for _, cmd, _ in concurrent_steps],
+            [stream for _, _, stream in concurrent_steps],
+        )
+    )
+    for (name, _, stream), (code, stdout, stderr) in zip(concurrent_steps, results, strict=True):
+        if not stream:
+            _print_output(stdout, stderr)
+        _report_step(name, code)
+        if code != 0:
+            exit_code = code
 
     return exit_code
 
@@ -2,14 +2,103 @@
 
 import argparse
 import ast
+import os
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntEnum
+from functools import partial
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
-from skillpack.utils.output import get_output_dir, write_text
+from skillpack.utils.output import dumps_json, get_output_dir, write_text
+
+# Below this many files, process start-up costs more than it saves
+_PARALLEL_MIN_FILES = 4
+
+# Lines whose first non-blank character is not a comment marker
+_CODE_LINE_RE = re.compile(rb"^[^\S\n]*[^#\s]", re.MULTILINE)
+
+# Nodes whose children can include a def; outside any function the scan
+# only descends into these, skipping expression subtrees that cannot
+_DEF_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+# Statements that add a level of nesting
+_NEST_TYPES = (ast.If, ast.For, ast.While, ast.With, ast.Try)
+# Decision points each node type adds to cyclomatic complexity, looked up by
+# exact type in one dict probe rather than an isinstance cascade
+_DECISION_POINTS: dict[type[ast.AST], Callable[[Any], int]] = {
+    ast.If: lambda node: 1,
+    ast.While: lambda node: 1,
+    ast.For: lambda node: 1,
+    ast.ExceptHandler: lambda node: 1,
+    ast.BoolOp: lambda node: len(node.values) - 1,
+    ast.comprehension: lambda node: 1 + len(node.ifs),
+    ast.Match: lambda node: len(node.cases),
+}
+
+
+class IssueTag(IntEnum):
+    """Kinds of issue find_hotspots can raise for a function."""
+
+    HIGH_COMPLEXITY = 1
+    LONG_FUNCTION = 2
+    TOO_MANY_ARGS = 3
+    NESTED = 4
+    DEEP_NESTING = 5
+
+
+# Suggestion fields per issue tag, so generate_suggestions dispatches with a
+# dict lookup instead of substring tests on the issue messages. Nested
+# functions get no suggestion of their own.
+_SUGGESTION_TEMPLATES: dict[IssueTag, dict[str, str]] = {
+    IssueTag.HIGH_COMPLEXITY: {
+        "type": "extract_method",
+        "description": "Extract conditional branches into separate methods",
+        "priority": "high",
+    },
+    IssueTag.LONG_FUNCTION: {
+        "type": "split_function",
+        "description": "Split into smaller, focused functions",
+        "priority": "high",
+    },
+    IssueTag.TOO_MANY_ARGS: {
+        "type": "introduce_parameter_object",
+        "description": "Group related parameters into a dataclass",
+        "priority": "medium",
+    },
+    IssueTag.DEEP_NESTING: {
+        "type": "guard_clauses",
+        "description": "Use early returns/guard clauses to reduce nesting",
+        "priority": "medium",
+    },
+}
+
+
+@dataclass
+class FunctionInfo:
+    """Metrics for one function, gathered by scan_tree."""
+
+    name: str
+    line: int
+    loc: int
+    args: int
+    complexity: int = 1
+    nested: int = 0
+    depth: int = 0
+    # Nesting level of the def itself, so depth can be measured relative to it
+    base_depth: int = 0
+
+
+@dataclass
+class TreeScan:
+    """Everything the analysis needs from a module's AST, from a single walk."""
+
+    functions: list[FunctionInfo]
+    classes: list[dict]
 
 
 def handler(args: argparse.Namespace) -> int:
@@ -72,41 +161,38 @@ def refactor_skill_main(
 
     try:
         # Collect files
-        if source_path.is_file():
-            files = [source_path]
-        else:
-            files = list(source_path.rglob("*.py"))
+        files = [source_path] if source_path.is_file() else list(_iter_py_files(source_path))
 
         all_hotspots = []
         all_suggestions = []
         file_metrics = []
 
-        for file_path in files:
-            try:
-                source = file_path.read_text()
-                tree = ast.parse(source)
-
-                # Analyze file
-                metrics = analyze_file(file_path, tree, source)
-                file_metrics.append(metrics)
-
-                # Find hotspots
-                hotspots = find_hotspots(file_path, tree, source, threshold)
-                all_hotspots.extend(hotspots)
-
-                # Generate suggestions
-                suggestions = generate_suggestions(file_path, tree, source, hotspots)
-                all_suggestions.extend(suggestions)
+        analyze = partial(_analyze_one, threshold=threshold)
+        if len(files) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(analyze, files, chunksize=8))
+        else:
+            results = [analyze(file_path) for file_path in files]
 
-            except SyntaxError:
+        for result in results:
+            if result is None:
                 continue
+            metrics, hotspots, suggestions = result
+            file_metrics.append(metrics)
+            all_hotspots.extend(hotspots)
+            all_suggestions.extend(suggestions)
+
+        # One timestamp so the report and the metrics agree
+        generated = datetime.now()
 
         # Generate report
-        report = generate_report(file_metrics, all_hotspots, all_suggestions, threshold)
+        report = generate_report(
+            file_metrics, all_hotspots, all_suggestions, threshold, generated
+        )
         write_text(content=report, filename="refactor_report.md", skill_name="refactor_skill", output_dir=output_dir)
 
         # Generate metrics JSON
-        metrics_json = generate_metrics_json(file_metrics, all_hotspots)
+        metrics_json = generate_metrics_json(file_metrics, all_hotspots, generated)
         write_text(content=metrics_json, filename="metrics.json", skill_name="refactor_skill", output_dir=output_dir)
 
         return {
@@ -122,24 +208,85 @@ def refactor_skill_main(
         return {"success": False, "error": str(e)}
 
 
-def analyze_file(file_path: Path, tree: ast.AST, source: str) -> dict:
-    """Analyze a file for complexity metrics."""
-    lines = source.split("\n")
-    
-    functions = []
-    classes = []
-    
-    for node in ast.walk(tree):
+def _iter_py_files(root: Path) -> Iterator[Path]:
+    """Yield the .py files under root, in the order Path.rglob would.
+
+    Walks with os.scandir on plain strings and only builds a Path for each
+    match. Like rglob, symlinked directories are not followed; unlike it,
+    directories or broken links named *.py are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+            except OSError:
+                continue
+        # Reversed so the first subdirectory is walked next (pre-order)
+        stack.extend(reversed(subdirs))
+
+
+def _analyze_one(
+    file_path: Path, threshold: int
+) -> tuple[dict, list[dict], list[dict]] | None:
+    """Parse and analyze one file; None if it is not valid Python.
+
+    Module-level so it can run in a worker process.
+    """
+    try:
+        # Bytes go straight to the parser, which honours coding cookies
+        source = file_path.read_bytes()
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    # One walk of the tree feeds both metrics and hotspots
+    scan = scan_tree(tree)
+    metrics = analyze_file(file_path, tree, source, scan)
+    hotspots = find_hotspots(file_path, tree, source, threshold, scan)
+    suggestions = generate_suggestions(file_path, tree, source, hotspots)
+    return metrics, hotspots, suggestions
+
+
+def scan_tree(tree: ast.AST) -> TreeScan:
+    """Collect function and class metrics in one breadth-first walk.
+
+    Each node's decision points and nesting are credited to every function
+    enclosing it, which gives the same numbers as walking each function
+    separately while visiting every node once. Outside functions only
+    statements are followed, since module- and class-level expressions
+    hold no defs. Functions come out in ast.walk order.
+    """
+    functions: list[FunctionInfo] = []
+    classes: list[dict] = []
+    enclosing_none: tuple[FunctionInfo, ...] = ()
+    queue = deque([(tree, 0, enclosing_none)])
+
+    while queue:
+        node, nest, enclosing = queue.popleft()
+
         if isinstance(node, ast.FunctionDef):
-            complexity = calculate_cyclomatic_complexity(node)
-            loc = node.end_lineno - node.lineno + 1 if node.end_lineno else 0
-            functions.append({
-                "name": node.name,
-                "line": node.lineno,
-                "complexity": complexity,
-                "loc": loc,
-                "args": len(node.args.args),
-            })
+            for outer in enclosing:
+                outer.nested += 1
+            info = FunctionInfo(
+                name=node.name,
+                line=node.lineno,
+                loc=node.end_lineno - node.lineno + 1 if node.end_lineno else 0,
+                args=len(node.args.args),
+                base_depth=nest,
+            )
+            functions.append(info)
+            enclosing = (*enclosing, info)
         elif isinstance(node, ast.ClassDef):
             method_count = sum(1 for n in node.body if isinstance(n, ast.FunctionDef))
             classes.append({
@@ -148,154 +295,150 @@ def analyze_file(file_path: Path, tree: ast.AST, source: str) -> dict:
                 "methods": method_count,
             })
 
+        if enclosing:
+            count_points = _DECISION_POINTS.get(type(node))
+            points = count_points(node) if count_points else 0
+            is_nest = isinstance(node, _NEST_TYPES)
+            if points or is_nest:
+                for func in enclosing:
+                    func.complexity += points
+                    if is_nest:
+                        func.depth = max(func.depth, nest - func.base_depth)
+
+        for child in ast.iter_child_nodes(node):
+            if enclosing or isinstance(child, _DEF_CONTAINERS):
+                queue.append((child, nest + isinstance(child, _NEST_TYPES), enclosing))
+
+    return TreeScan(functions=functions, classes=classes)
+
+
+def analyze_file(
+    file_path: Path, tree: ast.AST, source: str | bytes, scan: TreeScan | None = None
+) -> dict:
+    """Analyze a file for complexity metrics."""
+    if isinstance(source, str):
+        source = source.encode()
+    if scan is None:
+        scan = scan_tree(tree)
+
+    functions = [
+        {
+            "name": func.name,
+            "line": func.line,
+            "complexity": func.complexity,
+            "loc": func.loc,
+            "args": func.args,
+        }
+        for func in scan.functions
+    ]
+
     return {
         "file": str(file_path),
-        "total_lines": len(lines),
-        "code_lines": len([l for l in lines if l.strip() and not l.strip().startswith("#")]),
+        "total_lines": source.count(b"\n") + 1,
+        "code_lines": len(_CODE_LINE_RE.findall(source)),
         "functions": functions,
-        "classes": classes,
+        "classes": scan.classes,
         "avg_complexity": sum(f["complexity"] for f in functions) / len(functions) if functions else 0,
     }
 
 
 def calculate_cyclomatic_complexity(node: ast.FunctionDef) -> int:
     """Calculate cyclomatic complexity of a function."""
-    complexity = 1  # Base complexity
-    
-    for child in ast.walk(node):
-        # Decision points
-        if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-            complexity += 1
-        elif isinstance(child, ast.BoolOp):
-            complexity += len(child.values) - 1
-        elif isinstance(child, ast.comprehension):
-            complexity += 1 + len(child.ifs)
-        elif isinstance(child, ast.Match):
-            complexity += len(child.cases)
-    
-    return complexity
+    return scan_tree(node).functions[0].complexity
 
 
 def find_hotspots(
-    file_path: Path, tree: ast.AST, source: str, threshold: int
+    file_path: Path,
+    tree: ast.AST,
+    source: str | bytes,
+    threshold: int,
+    scan: TreeScan | None = None,
 ) -> list[dict]:
     """Find complexity hotspots in code."""
     hotspots = []
-    lines = source.split("\n")
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            complexity = calculate_cyclomatic_complexity(node)
-            loc = node.end_lineno - node.lineno + 1 if node.end_lineno else 0
-            args_count = len(node.args.args)
-            
-            issues = []
-            
-            if complexity > threshold:
-                issues.append(f"High complexity: {complexity} (threshold: {threshold})")
-            
-            if loc > 50:
-                issues.append(f"Long function: {loc} lines")
-            
-            if args_count > 5:
-                issues.append(f"Too many arguments: {args_count}")
-            
-            # Check for nested functions
-            nested = sum(1 for n in ast.walk(node) if isinstance(n, ast.FunctionDef)) - 1
-            if nested > 0:
-                issues.append(f"Nested functions: {nested}")
-            
-            # Check for deep nesting
-            max_depth = calculate_nesting_depth(node)
-            if max_depth > 4:
-                issues.append(f"Deep nesting: {max_depth} levels")
-            
-            if issues:
-                hotspots.append({
-                    "file": str(file_path),
-                    "function": node.name,
-                    "line": node.lineno,
-                    "complexity": complexity,
-                    "loc": loc,
-                    "issues": issues,
-                })
-    
+    if scan is None:
+        scan = scan_tree(tree)
+
+    for func in scan.functions:
+        issues = []
+        tags = []
+
+        if func.complexity > threshold:
+            issues.append(f"High complexity: {func.complexity} (threshold: {threshold})")
+            tags.append(IssueTag.HIGH_COMPLEXITY)
+
+        if func.loc > 50:
+            issues.append(f"Long function: {func.loc} lines")
+            tags.append(IssueTag.LONG_FUNCTION)
+
+        if func.args > 5:
+            issues.append(f"Too many arguments: {func.args}")
+            tags.append(IssueTag.TOO_MANY_ARGS)
+
+        # Check for nested functions
+        if func.nested > 0:
+            issues.append(f"Nested functions: {func.nested}")
+            tags.append(IssueTag.NESTED)
+
+        # Check for deep nesting
+        if func.depth > 4:
+            issues.append(f"Deep nesting: {func.depth} levels")
+            tags.append(IssueTag.DEEP_NESTING)
+
+        if issues:
+            hotspots.append({
+                "file": str(file_path),
+                "file_name": file_path.name,
+                "function": func.name,
+                "line": func.line,
+                "complexity": func.complexity,
+                "loc": func.loc,
+                "issues": issues,
+                "issue_tags": tags,
+            })
+
     return hotspots
 
 
-def calculate_nesting_depth(node: ast.AST, depth: int = 0) -> int:
-    """Calculate maximum nesting depth."""
-    max_depth = depth
-    
-    for child in ast.iter_child_nodes(node):
-        if isinstance(child, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
-            child_depth = calculate_nesting_depth(child, depth + 1)
-            max_depth = max(max_depth, child_depth)
-        else:
-            child_depth = calculate_nesting_depth(child, depth)
-            max_depth = max(max_depth, child_depth)
-    
-    return max_depth
+def calculate_nesting_depth(node: ast.FunctionDef, depth: int = 0) -> int:
+    """Calculate maximum nesting depth within a function."""
+    return depth + scan_tree(node).functions[0].depth
 
 
 def generate_suggestions(
-    file_path: Path, tree: ast.AST, source: str, hotspots: list
+    file_path: Path, tree: ast.AST, source: str | bytes, hotspots: list
 ) -> list[dict]:
     """Generate refactoring suggestions."""
     suggestions = []
-    
+    file = str(file_path)
+    file_name = file_path.name
+
     for hotspot in hotspots:
-        func_name = hotspot["function"]
-        
-        for issue in hotspot["issues"]:
-            if "High complexity" in issue:
+        for tag in hotspot["issue_tags"]:
+            template = _SUGGESTION_TEMPLATES.get(tag)
+            if template is not None:
                 suggestions.append({
-                    "file": str(file_path),
-                    "function": func_name,
+                    "file": file,
+                    "file_name": file_name,
+                    "function": hotspot["function"],
                     "line": hotspot["line"],
-                    "type": "extract_method",
-                    "description": f"Extract conditional branches into separate methods",
-                    "priority": "high",
+                    **template,
                 })
-            
-            if "Long function" in issue:
-                suggestions.append({
-                    "file": str(file_path),
-                    "function": func_name,
-                    "line": hotspot["line"],
-                    "type": "split_function",
-                    "description": "Split into smaller, focused functions",
-                    "priority": "high",
-                })
-            
-            if "Too many arguments" in issue:
-                suggestions.append({
-                    "file": str(file_path),
-                    "function": func_name,
-                    "line": hotspot["line"],
-                    "type": "introduce_parameter_object",
-                    "description": "Group related parameters into a dataclass",
-                    "priority": "medium",
-                })
-            
-            if "Deep nesting" in issue:
-                suggestions.append({
-                    "file": str(file_path),
-                    "function": func_name,
-                    "line": hotspot["line"],
-                    "type": "guard_clauses",
-                    "description": "Use early returns/guard clauses to reduce nesting",
-                    "priority": "medium",
-                })
-    
+
     return suggestions
 
 
 def generate_report(
-    file_metrics: list, hotspots: list, suggestions: list, threshold: int
+    file_metrics: list,
+    hotspots: list,
+    suggestions: list,
+    threshold: int,
+    generated: datetime | None = None,
 ) -> str:
     """Generate markdown report."""
-    
+    if generated is None:
+        generated = datetime.now()
+
     # Summary stats
     total_functions = sum(len(m["functions"]) for m in file_metrics)
     total_lines = sum(m["total_lines"] for m in file_metrics)
@@ -305,7 +448,7 @@ def generate_report(
     hotspot_rows = []
     for h in sorted(hotspots, key=lambda x: x["complexity"], reverse=True)[:10]:
         hotspot_rows.append(
-            f"| {Path(h['file']).name} | {h['function']} | {h['line']} | {h['complexity']} | {h['loc']} |"
+            f"| {h['file_name']} | {h['function']} | {h['line']} | {h['complexity']} | {h['loc']} |"
         )
     hotspot_table = "\n".join(hotspot_rows) if hotspot_rows else "| No hotspots found |"
     
@@ -318,7 +461,7 @@ def generate_report(
     for stype, items in suggestions_by_type.items():
         section = f"### {stype.replace('_', ' ').title()}\n"
         for item in items[:5]:
-            section += f"- `{item['function']}` ({Path(item['file']).name}:{item['line']}): {item['description']}\n"
+            section += f"- `{item['function']}` ({item['file_name']}:{item['line']}): {item['description']}\n"
         suggestion_sections.append(section)
     
     suggestions_md = "\n".join(suggestion_sections) if suggestion_sections else "No suggestions."
@@ -326,7 +469,7 @@ def generate_report(
     return dedent(f'''\
         # Refactoring Report
 
-        Generated by skillpack refactor-skill on {datetime.now().strftime("%Y-%m-%d %H:%M")}
+        Generated by skillpack refactor-skill on {generated.strftime("%Y-%m-%d %H:%M")}
 
         ## Summary
 
@@ -363,17 +506,23 @@ def generate_report(
     ''')
 
 
-def generate_metrics_json(file_metrics: list, hotspots: list) -> str:
+def generate_metrics_json(
+    file_metrics: list, hotspots: list, generated: datetime | None = None
+) -> str:
     """Generate metrics as JSON."""
-    import json
-    
-    return json.dumps({
-        "generated": datetime.now().isoformat(),
+    if generated is None:
+        generated = datetime.now()
+    return dumps_json({
+        "generated": generated.isoformat(),
         "files": file_metrics,
-        "hotspots": hotspots,
+        # Tags are for dispatch only; the issue messages carry the same facts
+        "hotspots": [
+            {key: value for key, value in h.items() if key != "issue_tags"}
+            for h in hotspots
+        ],
         "summary": {
             "total_files": len(file_metrics),
             "total_hotspots": len(hotspots),
             "total_functions": sum(len(m["functions"]) for m in file_metrics),
         },
-    }, indent=2)
+    })
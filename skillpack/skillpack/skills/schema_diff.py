@@ -3,17 +3,52 @@
 import argparse
 import json
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from skillpack.utils.logging import get_logger
 from skillpack.utils.output import get_output_dir
 
 SKILL_NAME = "schema_diff"
 
-
-@dataclass
-class Column:
+# Constant blocks of the generated migration files
+_SQL_FORWARD_HEADER = (
+    "",
+    "-- ============================================",
+    "-- MIGRATION: Forward",
+    "-- ============================================",
+    "",
+)
+_SQL_ROLLBACK_HEADER = (
+    "-- ============================================",
+    "-- ROLLBACK: Reverse migration",
+    "-- ============================================",
+    "",
+)
+_NOTES_MODIFIED_TABLE_HEADER = (
+    "| Property | Old | New |",
+    "|----------|-----|-----|",
+)
+_NOTES_IMPACT_HEADER = (
+    "## Impact Assessment",
+    "",
+    "### Backfill Required",
+    "",
+)
+_NOTES_ROLLBACK_PLAN = (
+    "",
+    "### Rollback Plan",
+    "",
+    "1. Restore from backup if data loss occurred",
+    "2. Run the rollback SQL statements in `migration.sql`",
+    "3. Verify data integrity after rollback",
+    "",
+)
+
+
+class Column(NamedTuple):
     """Represents a database column."""
 
     name: str
@@ -25,10 +60,10 @@ class Column:
     def from_dict(cls, data: dict[str, Any]) -> "Column":
         """Create a Column from a dictionary."""
         return cls(
-            name=data["name"],
-            type=data["type"],
-            nullable=data.get("nullable", True),
-            pk=data.get("pk", False),
+            data["name"],
+            data["type"],
+            data.get("nullable", True),
+            data.get("pk", False),
         )
 
 
@@ -45,6 +80,10 @@ class SchemaDiff:
 def parse_schema(schema_path: str | Path) -> dict[str, Column]:
     """Parse a schema JSON file.
 
+    Parsed files are cached by path, modification time and size, so
+    re-running a diff against an unchanged schema skips the read and
+    decode. Columns are immutable, so sharing them between calls is safe.
+
     Args:
         schema_path: Path to the schema JSON file.
 
@@ -55,9 +94,20 @@ def parse_schema(schema_path: str | Path) -> dict[str, Column]:
     if not path.exists():
         raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    stat = path.stat()
+    return dict(_parse_schema_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
 
+@lru_cache(maxsize=128)
+def _parse_schema_cached(path: str, mtime_ns: int, size: int) -> dict[str, Column]:
+    """Read and decode a schema file; mtime and size only serve as cache key."""
+    # json detects the encoding of bytes itself, skipping the text wrapper
+    with open(path, "rb") as f:
+        return _parse_schema_dict(json.load(f))
+
+
+def _parse_schema_dict(data: dict[str, Any]) -> dict[str, Column]:
+    """Build Column objects from already-decoded schema JSON."""
     columns = data.get("columns", [])
     return {col["name"]: Column.from_dict(col) for col in columns}
 
@@ -72,29 +122,34 @@ def diff_schemas(old_schema: dict[str, Column], new_schema: dict[str, Column]) -
     Returns:
         SchemaDiff with all differences.
     """
-    old_names = set(old_schema.keys())
-    new_names = set(new_schema.keys())
+    added = [(name, col) for name, col in new_schema.items() if name not in old_schema]
 
-    added = [new_schema[name] for name in sorted(new_names - old_names)]
-    removed = [old_schema[name] for name in sorted(old_names - new_names)]
-
-    # Check for modifications in common columns
+    # One pass over the old schema finds removals and modifications; only the
+    # (usually short) result lists are sorted, not the full set of names
+    removed = []
     modified = []
     pk_changes = []
-    for name in sorted(old_names & new_names):
-        old_col = old_schema[name]
-        new_col = new_schema[name]
+    for name, old_col in old_schema.items():
+        new_col = new_schema.get(name)
+        if new_col is None:
+            removed.append((name, old_col))
+            continue
 
         if old_col.type != new_col.type or old_col.nullable != new_col.nullable:
-            modified.append((old_col, new_col))
+            modified.append((name, old_col, new_col))
 
         if old_col.pk != new_col.pk:
             pk_changes.append((name, old_col.pk, new_col.pk))
 
+    added.sort(key=itemgetter(0))
+    removed.sort(key=itemgetter(0))
+    modified.sort(key=itemgetter(0))
+    pk_changes.sort(key=itemgetter(0))
+
     return SchemaDiff(
-        added_columns=added,
-        removed_columns=removed,
-        modified_columns=modified,
+        added_columns=[col for _, col in added],
+        removed_columns=[col for _, col in removed],
+        modified_columns=[(old_col, new_col) for _, old_col, new_col in modified],
         pk_changes=pk_changes,
     )
 
@@ -112,11 +167,7 @@ def generate_migration_sql(diff: SchemaDiff, table_name: str = "table_name") ->
     lines = [
         "-- Auto-generated migration script",
         f"-- Table: {table_name}",
-        "",
-        "-- ============================================",
-        "-- MIGRATION: Forward",
-        "-- ============================================",
-        "",
+        *_SQL_FORWARD_HEADER,
     ]
 
     # Add columns
@@ -166,12 +217,7 @@ def generate_migration_sql(diff: SchemaDiff, table_name: str = "table_name") ->
         lines.append("")
 
     # Rollback section
-    lines.extend([
-        "-- ============================================",
-        "-- ROLLBACK: Reverse migration",
-        "-- ============================================",
-        "",
-    ])
+    lines.extend(_SQL_ROLLBACK_HEADER)
 
     # Reverse add -> remove
     for col in diff.added_columns:
@@ -246,19 +292,13 @@ def generate_migration_notes(
         for old_col, new_col in diff.modified_columns:
             lines.append(f"### {old_col.name}")
             lines.append("")
-            lines.append(f"| Property | Old | New |")
-            lines.append(f"|----------|-----|-----|")
+            lines.extend(_NOTES_MODIFIED_TABLE_HEADER)
             lines.append(f"| Type | {old_col.type} | {new_col.type} |")
             lines.append(f"| Nullable | {old_col.nullable} | {new_col.nullable} |")
             lines.append("")
         lines.append("")
 
-    lines.extend([
-        "## Impact Assessment",
-        "",
-        "### Backfill Required",
-        "",
-    ])
+    lines.extend(_NOTES_IMPACT_HEADER)
 
     if diff.added_columns:
         non_null_added = [c for c in diff.added_columns if not c.nullable]
@@ -271,15 +311,7 @@ def generate_migration_notes(
     else:
         lines.append("No new columns added.")
 
-    lines.extend([
-        "",
-        "### Rollback Plan",
-        "",
-        "1. Restore from backup if data loss occurred",
-        "2. Run the rollback SQL statements in `migration.sql`",
-        "3. Verify data integrity after rollback",
-        "",
-    ])
+    lines.extend(_NOTES_ROLLBACK_PLAN)
 
     return "\n".join(lines)
 
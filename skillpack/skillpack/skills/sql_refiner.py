@@ -3,45 +3,100 @@
 import argparse
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from skillpack.utils.logging import get_logger
 from skillpack.utils.output import get_output_dir, write_text
 
 SKILL_NAME = "sql_refiner"
 
+_LAST_INTERVAL_RE = re.compile(r"last (\d+) (day|week|month|year)s?")
+_LIMIT_RE = re.compile(r"(?:top|first|last) (\d+)")
+
+# Every keyword extract_entities looks for, found in one scan. The lookahead
+# matches at each position, so overlapping and nested keywords are all seen,
+# the same as a separate substring test per keyword.
+_KEYWORDS_RE = re.compile(
+    r"(?=(count|how many|sum|total|average|avg|mean|maximum|max|highest|"
+    r"largest|minimum|min|lowest|smallest|active|last|top|bottom|first))"
+)
+_AGGREGATION_KEYWORDS = (
+    ("COUNT", frozenset({"count", "how many"})),
+    ("SUM", frozenset({"sum", "total"})),
+    ("AVG", frozenset({"average", "avg", "mean"})),
+    ("MAX", frozenset({"maximum", "max", "highest", "largest"})),
+    ("MIN", frozenset({"minimum", "min", "lowest", "smallest"})),
+)
+_DESC_KEYWORDS = frozenset({"top", "highest", "largest"})
+_ASC_KEYWORDS = frozenset({"bottom", "lowest", "smallest"})
+_DEFAULT_LIMIT_KEYWORDS = frozenset({"top", "first"})
+
+
+# Static tail of query_notes.md, up to the opening of the query fence
+_NOTES_TAIL = """
+## Placeholders to Replace
+
+- `<table_name>`: Replace with actual table name
+- `<group_column>`: Replace with column to group by (if applicable)
+
+## Performance Tips
+
+1. Ensure indexed columns are used in WHERE clause
+2. Avoid SELECT * in production queries
+3. Use appropriate data types for comparisons
+4. Consider partitioning for large tables
+
+## Generated Query
+
+```sql
+"""
+
+
+class DialectConfig(NamedTuple):
+    """SQL syntax templates for one dialect."""
+
+    string_agg: str
+    date_trunc: str
+    current_timestamp: str
+    limit: str
+    ilike: str
+    concat: str
+    bool_type: str
+    json_extract: str
+
+
 # Dialect-specific syntax differences
 DIALECT_CONFIG = {
-    "postgres": {
-        "string_agg": "STRING_AGG({col}, ', ')",
-        "date_trunc": "DATE_TRUNC('{unit}', {col})",
-        "current_timestamp": "CURRENT_TIMESTAMP",
-        "limit": "LIMIT {n}",
-        "ilike": "ILIKE",
-        "concat": "{a} || {b}",
-        "bool_type": "BOOLEAN",
-        "json_extract": "{col}->'{key}'",
-    },
-    "bigquery": {
-        "string_agg": "STRING_AGG({col}, ', ')",
-        "date_trunc": "DATE_TRUNC({col}, {unit})",
-        "current_timestamp": "CURRENT_TIMESTAMP()",
-        "limit": "LIMIT {n}",
-        "ilike": "LIKE",  # BigQuery doesn't have ILIKE
-        "concat": "CONCAT({a}, {b})",
-        "bool_type": "BOOL",
-        "json_extract": "JSON_EXTRACT({col}, '$.{key}')",
-    },
-    "snowflake": {
-        "string_agg": "LISTAGG({col}, ', ')",
-        "date_trunc": "DATE_TRUNC('{unit}', {col})",
-        "current_timestamp": "CURRENT_TIMESTAMP()",
-        "limit": "LIMIT {n}",
-        "ilike": "ILIKE",
-        "concat": "{a} || {b}",
-        "bool_type": "BOOLEAN",
-        "json_extract": "{col}:{key}",
-    },
+    "postgres": DialectConfig(
+        string_agg="STRING_AGG({col}, ', ')",
+        date_trunc="DATE_TRUNC('{unit}', {col})",
+        current_timestamp="CURRENT_TIMESTAMP",
+        limit="LIMIT {n}",
+        ilike="ILIKE",
+        concat="{a} || {b}",
+        bool_type="BOOLEAN",
+        json_extract="{col}->'{key}'",
+    ),
+    "bigquery": DialectConfig(
+        string_agg="STRING_AGG({col}, ', ')",
+        date_trunc="DATE_TRUNC({col}, {unit})",
+        current_timestamp="CURRENT_TIMESTAMP()",
+        limit="LIMIT {n}",
+        ilike="LIKE",  # BigQuery doesn't have ILIKE
+        concat="CONCAT({a}, {b})",
+        bool_type="BOOL",
+        json_extract="JSON_EXTRACT({col}, '$.{key}')",
+    ),
+    "snowflake": DialectConfig(
+        string_agg="LISTAGG({col}, ', ')",
+        date_trunc="DATE_TRUNC('{unit}', {col})",
+        current_timestamp="CURRENT_TIMESTAMP()",
+        limit="LIMIT {n}",
+        ilike="ILIKE",
+        concat="{a} || {b}",
+        bool_type="BOOLEAN",
+        json_extract="{col}:{key}",
+    ),
 }
 
 
@@ -64,90 +119,72 @@ def extract_entities(question: str) -> dict[str, Any]:
     }
 
     question_lower = question.lower()
+    found = set(_KEYWORDS_RE.findall(question_lower))
 
     # Common aggregation patterns
-    if any(word in question_lower for word in ["count", "how many"]):
-        entities["aggregations"].append("COUNT")
-    if any(word in question_lower for word in ["sum", "total"]):
-        entities["aggregations"].append("SUM")
-    if any(word in question_lower for word in ["average", "avg", "mean"]):
-        entities["aggregations"].append("AVG")
-    if any(word in question_lower for word in ["maximum", "max", "highest", "largest"]):
-        entities["aggregations"].append("MAX")
-    if any(word in question_lower for word in ["minimum", "min", "lowest", "smallest"]):
-        entities["aggregations"].append("MIN")
+    for aggregation, keywords in _AGGREGATION_KEYWORDS:
+        if not keywords.isdisjoint(found):
+            entities["aggregations"].append(aggregation)
 
     # Common condition patterns
-    if "active" in question_lower:
+    if "active" in found:
         entities["conditions"].append("status = 'active'")
-    if "last" in question_lower:
+    if "last" in found:
         # Try to extract time period
-        time_match = re.search(r"last (\d+) (day|week|month|year)s?", question_lower)
+        time_match = _LAST_INTERVAL_RE.search(question_lower)
         if time_match:
             num, unit = time_match.groups()
             entities["conditions"].append(f"created_at >= NOW() - INTERVAL '{num} {unit}s'")
 
     # Ordering
-    if any(word in question_lower for word in ["top", "highest", "largest"]):
+    if not _DESC_KEYWORDS.isdisjoint(found):
         entities["ordering"] = "DESC"
-    if any(word in question_lower for word in ["bottom", "lowest", "smallest"]):
+    if not _ASC_KEYWORDS.isdisjoint(found):
         entities["ordering"] = "ASC"
 
     # Limit
-    limit_match = re.search(r"(top|first|last) (\d+)", question_lower)
+    limit_match = _LIMIT_RE.search(question_lower)
     if limit_match:
-        entities["limit"] = int(limit_match.group(2))
-    elif "top" in question_lower or "first" in question_lower:
+        entities["limit"] = int(limit_match.group(1))
+    elif not _DEFAULT_LIMIT_KEYWORDS.isdisjoint(found):
         entities["limit"] = 10  # Default limit
 
     return entities
 
 
-def generate_query_template(question: str, dialect: str) -> str:
+def generate_query_template(
+    question: str, dialect: str, entities: dict[str, Any] | None = None
+) -> str:
     """Generate a SQL query template from a question.
 
     Args:
         question: The natural language question.
         dialect: SQL dialect (postgres, bigquery, snowflake).
+        entities: Result of extract_entities(question), if already computed.
 
     Returns:
         SQL query string.
     """
-    entities = extract_entities(question)
+    if entities is None:
+        entities = extract_entities(question)
     config = DIALECT_CONFIG.get(dialect, DIALECT_CONFIG["postgres"])
 
-    # Build basic query structure
-    lines = []
+    aggregations = entities["aggregations"]
+    conditions = entities["conditions"]
 
-    # Determine SELECT clause
-    if entities["aggregations"]:
-        agg = entities["aggregations"][0]
-        lines.append(f"SELECT {agg}(*) AS result")
+    # Each optional clause is either empty or starts on its own line, so the
+    # query is rendered in one f-string
+    select = f"SELECT {aggregations[0]}(*) AS result" if aggregations else "SELECT *"
+    if conditions:
+        where = "WHERE " + " AND ".join(conditions)
     else:
-        lines.append("SELECT *")
+        where = "WHERE 1=1  -- Add your conditions here"
+    # GROUP BY only when aggregating
+    group_by = "\nGROUP BY <group_column>" if aggregations and "group" in question.lower() else ""
+    order_by = f"\nORDER BY result {entities['ordering']}" if entities["ordering"] else ""
+    limit = "\n" + config.limit.format(n=entities["limit"]) if entities["limit"] else ""
 
-    # Add FROM clause (placeholder)
-    lines.append("FROM <table_name>")
-
-    # Add WHERE clause if conditions exist
-    if entities["conditions"]:
-        lines.append("WHERE " + " AND ".join(entities["conditions"]))
-    else:
-        lines.append("WHERE 1=1  -- Add your conditions here")
-
-    # Add GROUP BY if aggregating
-    if entities["aggregations"] and "group" in question.lower():
-        lines.append("GROUP BY <group_column>")
-
-    # Add ORDER BY
-    if entities["ordering"]:
-        lines.append(f"ORDER BY result {entities['ordering']}")
-
-    # Add LIMIT
-    if entities["limit"]:
-        lines.append(config["limit"].format(n=entities["limit"]))
-
-    return "\n".join(lines) + ";"
+    return f"{select}\nFROM <table_name>\n{where}{group_by}{order_by}{limit};"
 
 
 def generate_explain_query(query: str, dialect: str) -> str:
@@ -169,66 +206,39 @@ def generate_explain_query(query: str, dialect: str) -> str:
     return f"EXPLAIN\n{query}"
 
 
-def generate_notes(question: str, query: str, dialect: str) -> str:
+def generate_notes(
+    question: str, query: str, dialect: str, entities: dict[str, Any] | None = None
+) -> str:
     """Generate notes about the query.
 
     Args:
         question: The original question.
         query: The generated query.
         dialect: SQL dialect.
+        entities: Result of extract_entities(question), if already computed.
 
     Returns:
         Markdown notes.
     """
-    entities = extract_entities(question)
-
-    lines = [
-        "# Query Notes",
-        "",
-        "## Original Question",
-        "",
-        f"> {question}",
-        "",
-        "## Dialect",
-        "",
-        f"**{dialect.upper()}**",
-        "",
-        "## Query Analysis",
-        "",
-    ]
+    if entities is None:
+        entities = extract_entities(question)
 
+    analysis = []
     if entities["aggregations"]:
-        lines.append(f"- **Aggregations detected:** {', '.join(entities['aggregations'])}")
+        analysis.append(f"- **Aggregations detected:** {', '.join(entities['aggregations'])}\n")
     if entities["conditions"]:
-        lines.append(f"- **Conditions detected:** {len(entities['conditions'])}")
+        analysis.append(f"- **Conditions detected:** {len(entities['conditions'])}\n")
     if entities["limit"]:
-        lines.append(f"- **Limit:** {entities['limit']}")
+        analysis.append(f"- **Limit:** {entities['limit']}\n")
     if entities["ordering"]:
-        lines.append(f"- **Ordering:** {entities['ordering']}")
-
-    lines.extend([
-        "",
-        "## Placeholders to Replace",
-        "",
-        "- `<table_name>`: Replace with actual table name",
-        "- `<group_column>`: Replace with column to group by (if applicable)",
-        "",
-        "## Performance Tips",
-        "",
-        "1. Ensure indexed columns are used in WHERE clause",
-        "2. Avoid SELECT * in production queries",
-        "3. Use appropriate data types for comparisons",
-        "4. Consider partitioning for large tables",
-        "",
-        "## Generated Query",
-        "",
-        "```sql",
-        query,
-        "```",
-        "",
-    ])
-
-    return "\n".join(lines)
+        analysis.append(f"- **Ordering:** {entities['ordering']}\n")
+
+    # One f-string build; str.format would re-parse a template on every call
+    return (
+        f"# Query Notes\n\n## Original Question\n\n> {question}\n\n"
+        f"## Dialect\n\n**{dialect.upper()}**\n\n"
+        f"## Query Analysis\n\n{''.join(analysis)}{_NOTES_TAIL}{query}\n```\n"
+    )
 
 
 def refine_sql(
@@ -253,10 +263,11 @@ def refine_sql(
 
     logger.info(f"Generating {dialect} SQL for: {question}")
 
-    # Generate query
-    query = generate_query_template(question, dialect)
+    # Generate query; the entities feed both the query and the notes
+    entities = extract_entities(question)
+    query = generate_query_template(question, dialect, entities)
     explain = generate_explain_query(query, dialect)
-    notes = generate_notes(question, query, dialect)
+    notes = generate_notes(question, query, dialect, entities)
 
     output_dir = get_output_dir(SKILL_NAME, base_dir)
 
@@ -6,6 +6,13 @@ from typing import Any
 
 import yaml
 
+# libyaml's C parser is several times faster; PyYAML silently builds without it
+YamlSafeLoader: type[yaml.SafeLoader] | type[yaml.CSafeLoader]
+try:
+    YamlSafeLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover - optional speedup
+    YamlSafeLoader = yaml.SafeLoader
+
 
 def load_yaml(path: str | Path) -> dict[str, Any]:
     """Load a YAML configuration file.
@@ -24,8 +31,8 @@ def load_yaml(path: str | Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # The parser decodes bytes itself (honouring a BOM) from a single read
+    return yaml.load(path.read_bytes(), Loader=YamlSafeLoader) or {}
 
 
 def load_json(path: str | Path) -> dict[str, Any]:
@@ -45,8 +52,7 @@ def load_json(path: str | Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(path.read_bytes())
 
 
 def load_config(path: str | Path) -> dict[str, Any]:
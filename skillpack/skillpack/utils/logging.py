@@ -4,6 +4,10 @@ import logging
 import sys
 from typing import Optional
 
+# logging hands out one Logger per name for the life of the process, so the
+# package logger can be looked up once instead of under the manager's lock
+_DEFAULT_LOGGER = logging.getLogger("skillpack")
+
 
 def setup_logging(
     name: str = "skillpack",
@@ -53,4 +57,6 @@ def get_logger(name: str = "skillpack") -> logging.Logger:
     Returns:
         Logger instance.
     """
+    if name == "skillpack":
+        return _DEFAULT_LOGGER
     return logging.getLogger(name)
@@ -4,7 +4,12 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HAS_ORJSON = False
 
 
 def get_output_dir(skill_name: str, base_dir: str = "./out") -> Path:
@@ -44,26 +49,43 @@ def write_text(
         Path to the written file.
     """
     # Use provided output_dir or compute from skill_name
-    if output_dir is not None:
-        target_dir = Path(output_dir)
-    else:
-        target_dir = get_output_dir(skill_name, base_dir)
-    
+    target_dir = Path(output_dir) if output_dir is not None else Path(base_dir) / skill_name
+
     if subdir:
         target_dir = target_dir / subdir
-    
-    # Ensure target directory exists
-    target_dir.mkdir(parents=True, exist_ok=True)
 
     output_path = target_dir / filename
-    
-    # Ensure parent directories exist (for nested filenames like "pkg/__init__.py")
+
+    # One mkdir covers the skill directory, the subdir and nested filenames
+    # like "pkg/__init__.py", since they are all ancestors of the file
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     output_path.write_text(content, encoding="utf-8")
     return output_path
 
 
+def dumps_json(data: Any, indent: int = 2, sort_keys: bool = False) -> str:
+    """Serialize data to indented JSON text, using orjson when it is installed.
+
+    orjson only indents by two spaces, so other indents use the stdlib.
+
+    Args:
+        data: Data to serialize.
+        indent: Indentation level.
+        sort_keys: Whether to sort object keys.
+
+    Returns:
+        JSON text, with non-ASCII characters left unescaped.
+    """
+    if _HAS_ORJSON and indent == 2:
+        # NON_STR_KEYS mirrors json.dumps turning int/float/bool keys into strings
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=sort_keys)
+
+
 def write_json(
     data: dict[str, Any] | list[Any],
     filename: str,
@@ -87,7 +109,7 @@ def write_json(
     Returns:
         Path to the written file.
     """
-    content = json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=True)
+    content = dumps_json(data, indent=indent, sort_keys=True)
     return write_text(content, filename, skill_name, subdir, base_dir, output_dir)
 
 
@@ -112,5 +134,12 @@ def write_yaml(
     Returns:
         Path to the written file.
     """
-    content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=True)
+    # Imported here so skills that never write YAML do not load PyYAML
+    import yaml
+
+    # libyaml's emitter when PyYAML was built with it
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    content = yaml.dump(
+        data, Dumper=dumper, default_flow_style=False, allow_unicode=True, sort_keys=True
+    )
     return write_text(content, filename, skill_name, subdir, base_dir, output_dir)
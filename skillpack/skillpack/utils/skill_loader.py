@@ -13,16 +13,29 @@ Usage:
     )
 """
 
-import json
+import contextlib
+import copy
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from skillpack.utils.config import YamlSafeLoader
+from skillpack.utils.output import dumps_json
 
+# Keys list_skills adds to each metadata dict
+_LISTING_KEYS = ("_directory", "_path")
+
+
+@lru_cache(maxsize=1)
 def get_skills_directory() -> Path:
     """Get the path to the skills documentation directory.
 
+    The location is fixed relative to the package, so it is computed once.
+
     Returns:
         Path to the skills/ directory.
     """
@@ -43,6 +56,110 @@ def _normalize_skill_name(skill_name: str) -> str:
     return skill_name.replace("-", "_")
 
 
+def _skill_dir(skill_name: str) -> str:
+    """Path of a skill's directory, as a string.
+
+    Loader functions build a handful of child paths per call; joining plain
+    strings with os.path.join is much cheaper than creating Path objects.
+    """
+    return os.path.join(get_skills_directory(), _normalize_skill_name(skill_name))
+
+
+def _load_yaml(path: str | Path) -> Any:
+    """Load a YAML file, reusing the parse while the file is unchanged.
+
+    Listing and dependency checks read the same metadata files many times
+    in one run. Each call gets its own deep copy, since callers annotate
+    the returned dicts.
+    """
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    return copy.deepcopy(_load_yaml_cached(key, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=256)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime and size only serve as cache key."""
+    with open(path, "rb") as f:
+        return _intern_strings(yaml.load(f.read(), Loader=YamlSafeLoader))
+
+
+# Longer strings are descriptions and the like, which are rarely repeated
+_INTERN_MAX_LEN = 64
+
+
+def _intern_strings(value: Any) -> Any:
+    """Intern dict keys and short strings in parsed YAML.
+
+    Every metadata file repeats the same keys and draws tags, versions and
+    the like from a small vocabulary, but each parse creates fresh string
+    objects. Interning them once per parse makes the cached files share one
+    copy (deepcopy keeps strings as they are).
+    """
+    if isinstance(value, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k: _intern_strings(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+def _list_names(directory: str | Path, suffix: str) -> list[str]:
+    """List entry names in a directory ending with suffix.
+
+    Equivalent to ``[p.name for p in directory.glob("*" + suffix)]`` but
+    matches on the names from scandir without building Path objects.
+    Returns an empty list when the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it if entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+
+
+def _read_text(path: str | Path) -> str:
+    """Read a UTF-8 text file like Path.read_text, but faster for small files.
+
+    The file is read as bytes and decoded in one step rather than through a
+    TextIOWrapper; newlines are translated the same way text mode would.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        UnicodeDecodeError: If the file is not valid UTF-8.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.decode("utf-8")
+
+
+def _read_text_files(directory: str | Path, suffix: str = "") -> dict[str, str]:
+    """Read every UTF-8 file in a directory whose name ends with suffix.
+
+    Subdirectories and files that are not valid UTF-8 (binary files) are
+    skipped, and a missing directory gives an empty dict.
+    """
+    contents: dict[str, str] = {}
+    try:
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.name.endswith(suffix) and e.is_file()]
+    except FileNotFoundError:
+        return contents
+
+    for entry in entries:
+        try:
+            contents[entry.name] = _read_text(entry.path)
+        except UnicodeDecodeError:
+            continue
+    return contents
+
+
 # =============================================================================
 # TIER 1: Metadata Only (Always Loaded)
 # =============================================================================
@@ -62,34 +179,37 @@ def list_skills() -> list[dict[str, Any]]:
     if not skills_dir.exists():
         return skills
 
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
+    # scandir answers is_dir from the directory entry, without a stat per entry
+    with os.scandir(skills_dir) as it:
+        dir_names = sorted(entry.name for entry in it if entry.is_dir())
+
+    for dir_name in dir_names:
+        skill_dir = os.path.join(skills_dir, dir_name)
+
+        # Try new format first (metadata.yaml); a missing file surfaces as
+        # FileNotFoundError from the stat in _load_yaml, saving an exists() call
+        metadata_file = os.path.join(skill_dir, "metadata.yaml")
+        try:
+            data = _load_yaml(metadata_file)
+            data["_directory"] = dir_name
+            data["_path"] = metadata_file
+            skills.append(data)
+            continue
+        except FileNotFoundError:
+            pass
+        except (yaml.YAMLError, OSError):
             continue
 
-        # Try new format first (metadata.yaml)
-        metadata_file = skill_dir / "metadata.yaml"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    data["_directory"] = skill_dir.name
-                    data["_path"] = str(metadata_file)
-                    skills.append(data)
-            except (yaml.YAMLError, OSError):
-                continue
-        else:
-            # Fall back to old format (skill.yaml)
-            skill_file = skill_dir / "skill.yaml"
-            if skill_file.exists():
-                try:
-                    with open(skill_file, encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                        skill_info = data.get("skill", {})
-                        skill_info["_directory"] = skill_dir.name
-                        skill_info["_path"] = str(skill_file)
-                        skills.append(skill_info)
-                except (yaml.YAMLError, OSError):
-                    continue
+        # Fall back to old format (skill.yaml)
+        skill_file = os.path.join(skill_dir, "skill.yaml")
+        try:
+            data = _load_yaml(skill_file)
+            skill_info = data.get("skill", {})
+            skill_info["_directory"] = dir_name
+            skill_info["_path"] = skill_file
+            skills.append(skill_info)
+        except (yaml.YAMLError, OSError):
+            continue
 
     return skills
 
@@ -106,29 +226,33 @@ def get_skill_metadata(skill_name: str) -> dict[str, Any]:
     Raises:
         FileNotFoundError: If skill doesn't exist.
     """
-    dir_name = _normalize_skill_name(skill_name)
-    skills_dir = get_skills_directory()
-    
-    metadata_file = skills_dir / dir_name / "metadata.yaml"
-    if metadata_file.exists():
-        with open(metadata_file, encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    
+    skill_dir = _skill_dir(skill_name)
+
+    # A missing file surfaces from the stat in _load_yaml, so the common case
+    # needs no separate exists() call
+    try:
+        return _load_yaml(os.path.join(skill_dir, "metadata.yaml"))
+    except FileNotFoundError:
+        pass
+
     # Fall back to old format
-    skill_file = skills_dir / dir_name / "skill.yaml"
-    if skill_file.exists():
-        with open(skill_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return data.get("skill", data)
-    
-    raise FileNotFoundError(f"Skill not found: {skill_name}")
+    try:
+        data = _load_yaml(os.path.join(skill_dir, "skill.yaml"))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skill not found: {skill_name}") from None
+    return data.get("skill", data)
 
 
 # =============================================================================
 # TIER 2: Skill Procedure (On Selection)
 # =============================================================================
 
-def load_skill(skill_name: str) -> dict[str, Any]:
+def load_skill(
+    skill_name: str,
+    metadata: dict[str, Any] | None = None,
+    *,
+    list_contents: bool = True,
+) -> dict[str, Any]:
     """Load skill metadata and procedure (Tier 2).
 
     Includes metadata.yaml contents plus skill.md content.
@@ -136,6 +260,11 @@ def load_skill(skill_name: str) -> dict[str, Any]:
 
     Args:
         skill_name: Name of the skill.
+        metadata: Already-loaded metadata for the skill, which the result
+            is built on instead of reading metadata.yaml again.
+        list_contents: List docs/ and scripts/ into "available_docs" and
+            "available_scripts"; callers that only need skill.md can skip
+            both directory scans.
 
     Returns:
         Dictionary with metadata and skill_md content.
@@ -143,32 +272,22 @@ def load_skill(skill_name: str) -> dict[str, Any]:
     Raises:
         FileNotFoundError: If skill doesn't exist.
     """
-    dir_name = _normalize_skill_name(skill_name)
-    skills_dir = get_skills_directory()
-    skill_dir = skills_dir / dir_name
+    skill_dir = _skill_dir(skill_name)
 
-    if not skill_dir.exists():
+    if not os.path.exists(skill_dir):
         raise FileNotFoundError(f"Skill directory not found: {skill_dir}")
 
-    result = get_skill_metadata(skill_name)
+    result = get_skill_metadata(skill_name) if metadata is None else metadata
     result["_tier"] = 2
 
     # Load skill.md if exists
-    skill_md = skill_dir / "skill.md"
-    if skill_md.exists():
-        result["skill_md"] = skill_md.read_text(encoding="utf-8")
+    with contextlib.suppress(FileNotFoundError):
+        result["skill_md"] = _read_text(os.path.join(skill_dir, "skill.md"))
 
     # List available docs and scripts
-    docs_dir = skill_dir / "docs"
-    scripts_dir = skill_dir / "scripts"
-    
-    result["available_docs"] = []
-    if docs_dir.exists():
-        result["available_docs"] = [f.name for f in docs_dir.glob("*.md")]
-
-    result["available_scripts"] = []
-    if scripts_dir.exists():
-        result["available_scripts"] = [f.name for f in scripts_dir.glob("*.py")]
+    if list_contents:
+        result["available_docs"] = _list_names(os.path.join(skill_dir, "docs"), ".md")
+        result["available_scripts"] = _list_names(os.path.join(skill_dir, "scripts"), ".py")
 
     return result
 
@@ -177,11 +296,26 @@ def load_skill(skill_name: str) -> dict[str, Any]:
 # TIER 3: Full Content (On Execution)
 # =============================================================================
 
-def load_skill_full(skill_name: str) -> dict[str, Any]:
+def load_skill_full(
+    skill_name: str,
+    metadata: dict[str, Any] | None = None,
+    *,
+    include_docs: bool = True,
+    include_scripts: bool = True,
+    include_examples: bool = True,
+) -> dict[str, Any]:
     """Load complete skill content including docs and scripts (Tier 3).
 
+    Reading every file is the expensive part of this tier, so callers that
+    need only some of it can leave the rest out; the corresponding key is
+    then absent from the result.
+
     Args:
         skill_name: Name of the skill.
+        metadata: Already-loaded metadata for the skill, passed to load_skill.
+        include_docs: Read docs/*.md into "docs".
+        include_scripts: Read scripts/*.py into "scripts".
+        include_examples: Read examples/ into "examples_content".
 
     Returns:
         Complete skill dictionary with all content.
@@ -189,38 +323,22 @@ def load_skill_full(skill_name: str) -> dict[str, Any]:
     Raises:
         FileNotFoundError: If skill doesn't exist.
     """
-    result = load_skill(skill_name)
+    result = load_skill(skill_name, metadata)
     result["_tier"] = 3
 
-    dir_name = _normalize_skill_name(skill_name)
-    skills_dir = get_skills_directory()
-    skill_dir = skills_dir / dir_name
+    skill_dir = _skill_dir(skill_name)
 
     # Load all docs
-    result["docs"] = {}
-    docs_dir = skill_dir / "docs"
-    if docs_dir.exists():
-        for doc_file in docs_dir.glob("*.md"):
-            result["docs"][doc_file.name] = doc_file.read_text(encoding="utf-8")
+    if include_docs:
+        result["docs"] = _read_text_files(os.path.join(skill_dir, "docs"), ".md")
 
     # Load all scripts (just the code, for LLM understanding)
-    result["scripts"] = {}
-    scripts_dir = skill_dir / "scripts"
-    if scripts_dir.exists():
-        for script_file in scripts_dir.glob("*.py"):
-            result["scripts"][script_file.name] = script_file.read_text(encoding="utf-8")
-
-    # Load examples
-    result["examples_content"] = {}
-    examples_dir = skill_dir / "examples"
-    if examples_dir.exists():
-        for example_file in examples_dir.iterdir():
-            if example_file.is_file():
-                try:
-                    result["examples_content"][example_file.name] = example_file.read_text(encoding="utf-8")
-                except UnicodeDecodeError:
-                    # Binary file
-                    pass
+    if include_scripts:
+        result["scripts"] = _read_text_files(os.path.join(skill_dir, "scripts"), ".py")
+
+    # Load examples (binary files are skipped)
+    if include_examples:
+        result["examples_content"] = _read_text_files(os.path.join(skill_dir, "examples"))
 
     return result
 
@@ -238,14 +356,12 @@ def get_skill_doc(skill_name: str, doc_name: str) -> str:
     Raises:
         FileNotFoundError: If doc doesn't exist.
     """
-    dir_name = _normalize_skill_name(skill_name)
-    skills_dir = get_skills_directory()
-    doc_path = skills_dir / dir_name / "docs" / doc_name
+    doc_path = os.path.join(_skill_dir(skill_name), "docs", doc_name)
 
-    if not doc_path.exists():
+    if not os.path.exists(doc_path):
         raise FileNotFoundError(f"Doc not found: {doc_path}")
 
-    return doc_path.read_text(encoding="utf-8")
+    return _read_text(doc_path)
 
 
 def get_skill_script(skill_name: str, script_name: str) -> str:
@@ -261,14 +377,12 @@ def get_skill_script(skill_name: str, script_name: str) -> str:
     Raises:
         FileNotFoundError: If script doesn't exist.
     """
-    dir_name = _normalize_skill_name(skill_name)
-    skills_dir = get_skills_directory()
-    script_path = skills_dir / dir_name / "scripts" / script_name
+    script_path = os.path.join(_skill_dir(skill_name), "scripts", script_name)
 
-    if not script_path.exists():
+    if not os.path.exists(script_path):
         raise FileNotFoundError(f"Script not found: {script_path}")
 
-    return script_path.read_text(encoding="utf-8")
+    return _read_text(script_path)
 
 
 # =============================================================================
@@ -284,31 +398,32 @@ def get_skill_guardrails(skill_name: str) -> dict[str, list[str]]:
     Returns:
         Dictionary with 'allowed' and 'forbidden' lists.
     """
-    skill = load_skill(skill_name)
+    skill = load_skill(skill_name, list_contents=False)
     skill_md = skill.get("skill_md", "")
     
     guardrails = {"allowed": [], "forbidden": []}
-    
-    # Parse from skill.md
-    in_allowed = False
-    in_forbidden = False
-    
+
+    # Parse from skill.md; current is the list bullets go to, if any. Only
+    # lines containing "##" can change section, so everything else outside
+    # a section is skipped without being stripped.
+    current = None
     for line in skill_md.split("\n"):
+        if "##" in line:
+            if "## Allowed" in line:
+                current = guardrails["allowed"]
+                continue
+            if "## Forbidden" in line:
+                current = guardrails["forbidden"]
+                continue
+        elif current is None:
+            continue
+
         line = line.strip()
-        if "### Allowed" in line or "## Allowed" in line:
-            in_allowed = True
-            in_forbidden = False
-        elif "### Forbidden" in line or "## Forbidden" in line:
-            in_allowed = False
-            in_forbidden = True
-        elif line.startswith("##"):
-            in_allowed = False
-            in_forbidden = False
-        elif line.startswith("- ") and in_allowed:
-            guardrails["allowed"].append(line[2:])
-        elif line.startswith("- ") and in_forbidden:
-            guardrails["forbidden"].append(line[2:])
-    
+        if line.startswith("##"):
+            current = None
+        elif current is not None and line.startswith("- "):
+            current.append(line[2:])
+
     return guardrails
 
 
@@ -482,12 +597,9 @@ def format_skill_for_llm(skill_name: str, tier: int = 2) -> str:
     Returns:
         Formatted string representation.
     """
-    if tier == 1:
-        skill = get_skill_metadata(skill_name)
-    elif tier == 2:
-        skill = load_skill(skill_name)
-    else:
-        skill = load_skill_full(skill_name)
+    # Tier 3 content (docs, scripts, examples) is not part of the output,
+    # so there is no need to read it
+    skill = get_skill_metadata(skill_name) if tier == 1 else load_skill(skill_name)
 
     lines = [
         f"# Skill: {skill.get('name', skill_name)}",
@@ -524,12 +636,13 @@ def export_skills_json(tier: int = 1) -> str:
         skills_data = list_skills()
     else:
         skills_data = []
+        loader = load_skill if tier == 2 else load_skill_full
         for skill in list_skills():
             name = skill.get("name", skill.get("_directory", ""))
             if name:
-                if tier == 2:
-                    skills_data.append(load_skill(name))
-                else:
-                    skills_data.append(load_skill_full(name))
+                # Reuse the metadata list_skills already parsed, minus its
+                # listing-only keys
+                metadata = {k: v for k, v in skill.items() if k not in _LISTING_KEYS}
+                skills_data.append(loader(name, metadata))
 
-    return json.dumps({"skills": skills_data, "tier": tier}, indent=2, ensure_ascii=False)
+    return dumps_json({"skills": skills_data, "tier": tier})
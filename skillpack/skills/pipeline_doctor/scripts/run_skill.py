@@ -13,7 +13,15 @@ def main() -> int:
     """Run the pipeline-doctor skill via the CLI."""
     # Pass all arguments through to the skillpack CLI
     args = ["skillpack", "pipeline-doctor"] + sys.argv[1:]
-    return subprocess.call(args)
+    try:
+        from skillpack.cli import main as cli_main
+    except ImportError:
+        # skillpack is installed for a different interpreter; use its console script
+        return subprocess.call(args)
+
+    # Run in this process rather than starting a second interpreter
+    sys.argv = args
+    return cli_main()
 
 
 if __name__ == "__main__":
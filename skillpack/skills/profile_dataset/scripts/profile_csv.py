@@ -10,62 +10,174 @@ Usage:
 
 import argparse
 import csv
+import io
 import json
+import os
 import statistics
 import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # pragma: no cover - fall back to the statistics module
+    _HAS_NUMPY = False
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HAS_PYARROW = False
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - fall back to the json module
+    _HAS_ORJSON = False
+
+_BOOL_VALUES = frozenset(("true", "false", "yes", "no", "1", "0"))
+
+# Distinct values tracked per column before it is reported as high-cardinality
+_UNIQUE_LIMIT = 10_000
+_SAMPLE_VALUE_COUNT = 5
+
+# Spread columns across processes only for wide, large tables on multi-core hosts
+_PARALLEL_MIN_COLUMNS = 8
+_PARALLEL_MIN_CELLS = 1_000_000
+
 
 def infer_dtype(values: list[str]) -> str:
-    """Infer the data type from a list of string values."""
-    non_empty = [v for v in values if v.strip()]
-    if not non_empty:
+    """Infer the data type from a list of string values.
+
+    Integer is preferred over float, float over boolean. All three are
+    checked in one pass, which stops as soon as only string is left. Once a
+    single candidate is left (boolean is ruled out by the first value outside
+    _BOOL_VALUES), the remaining values are validated against it with
+    C-level calls instead of the per-value loop.
+    """
+    is_int = is_float = is_bool = True
+    seen = False
+
+    it = iter(values)
+    for v in it:
+        if not v.strip():
+            continue
+        seen = True
+
+        if is_bool and v.lower() not in _BOOL_VALUES:
+            is_bool = False
+        # Anything int() accepts, float() accepts too. Plain ASCII digit
+        # strings always parse, so they skip the int() call.
+        if is_int:
+            if not (v.isascii() and v.isdigit()):
+                try:
+                    int(v)
+                except ValueError:
+                    is_int = False
+            if is_int:
+                if not is_bool:
+                    break
+                continue
+        if is_float:
+            try:
+                float(v)
+            except ValueError:
+                is_float = False
+
+        if not (is_float or is_bool):
+            return "string"
+        if not (is_float and is_bool):
+            break
+
+    if not seen:
         return "string"
-
-    # Try integer
-    try:
-        for v in non_empty:
-            int(v)
-        return "integer"
-    except ValueError:
-        pass
-
-    # Try float
-    try:
-        for v in non_empty:
-            float(v)
+    rest: Iterator[str] = filter(str.strip, it)
+    if is_int:
+        # One isdigit() over the joined values settles plain digit columns;
+        # signs, spaces or other digits fall back to checking each value
+        remaining = list(rest)
+        joined = "".join(remaining)
+        if joined.isascii() and joined.isdigit():
+            return "integer"
+        for i, v in enumerate(remaining):
+            if v.isascii() and v.isdigit():
+                continue
+            try:
+                int(v)
+            except ValueError:
+                is_int = False
+                rest = iter(remaining[i:])
+                break
+        if is_int:
+            return "integer"
+    if is_float:
+        try:
+            deque(map(float, rest), maxlen=0)
+        except ValueError:
+            return "string"
         return "float"
-    except ValueError:
-        pass
-
-    # Try boolean
-    if all(v.lower() in ("true", "false", "yes", "no", "1", "0") for v in non_empty):
+    if _BOOL_VALUES.issuperset(map(str.lower, rest)):
         return "boolean"
-
     return "string"
 
 
 def profile_column(name: str, values: list[str]) -> dict[str, Any]:
     """Profile a single column."""
     total = len(values)
-    non_empty = [v for v in values if v.strip()]
+    # filter() runs the blank check in C; strip() returns the string itself
+    # unless there is whitespace to remove, so this allocates almost nothing
+    non_empty = list(filter(str.strip, values))
     null_count = total - len(non_empty)
-    unique = set(non_empty)
+
+    # ID-like columns stop growing the set once past the limit; adding a
+    # slice at a time keeps the hashing in C
+    unique: set[str] = set()
+    for start in range(0, len(non_empty), _UNIQUE_LIMIT):
+        unique.update(non_empty[start:start + _UNIQUE_LIMIT])
+        if len(unique) > _UNIQUE_LIMIT:
+            break
+
+    # First distinct values in file order, so samples are repeatable
+    samples: list[str] = []
+    sample_count = min(len(unique), _SAMPLE_VALUE_COUNT)
+    for v in non_empty:
+        if len(samples) == sample_count:
+            break
+        if v not in samples:
+            samples.append(v)
 
     profile: dict[str, Any] = {
         "name": name,
-        "dtype": infer_dtype(values),
+        "dtype": infer_dtype(non_empty),
         "total_count": total,
         "null_count": null_count,
         "null_rate": null_count / total if total > 0 else 0,
-        "unique_count": len(unique),
-        "sample_values": list(unique)[:5],
+        "unique_count": min(len(unique), _UNIQUE_LIMIT),
+        "unique_count_capped": len(unique) > _UNIQUE_LIMIT,
+        "sample_values": sorted(samples),
     }
 
     # Numeric statistics
-    if profile["dtype"] in ("integer", "float"):
+    if profile["dtype"] in ("integer", "float") and _HAS_NUMPY:
+        # One parse into a float64 buffer, then vectorized reductions
+        arr = np.fromiter(map(float, non_empty), dtype=np.float64, count=len(non_empty))
+        with np.errstate(invalid="ignore"):
+            profile["min_value"] = float(arr.min())
+            profile["max_value"] = float(arr.max())
+            profile["mean_value"] = float(arr.mean())
+            profile["median_value"] = float(np.median(arr))
+            if arr.size >= 2:
+                profile["std_dev"] = float(arr.std(ddof=1))
+    elif profile["dtype"] in ("integer", "float"):
         try:
             nums = [float(v) for v in non_empty]
             profile["min_value"] = min(nums)
@@ -87,63 +199,123 @@ def profile_column(name: str, values: list[str]) -> dict[str, Any]:
     return profile
 
 
+def read_columns_arrow(csv_path: Path, headers: list[str]) -> tuple[int, dict[str, list[str]]]:
+    """Read a CSV column-wise with pyarrow's C parser, keeping every value as text."""
+    table = pacsv.read_csv(
+        csv_path,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types=dict.fromkeys(headers, pa.string()),
+            strings_can_be_null=False,
+        ),
+    )
+    return table.num_rows, {h: table.column(h).to_pylist() for h in headers}
+
+
+def read_columns(csv_path: Path) -> tuple[list[str], int, dict[str, list[str]]]:
+    """Read a CSV into per-column value lists.
+
+    Uses pyarrow when it is installed and the csv module otherwise. Both
+    read with utf-8-sig, since Arrow drops a leading BOM from the first
+    column name and the headers must match its schema.
+    """
+    with open(csv_path, encoding="utf-8-sig") as f:
+        headers = next(csv.reader(f), [])
+
+    # Arrow rejects duplicate headers and ragged rows; the csv path handles both
+    if _HAS_PYARROW and headers and len(set(headers)) == len(headers):
+        try:
+            return headers, *read_columns_arrow(csv_path, headers)
+        except pa.ArrowInvalid:
+            pass
+
+    with open(csv_path, encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        width = len(headers)
+
+        # Append straight into the column lists while streaming rows. A
+        # duplicated header takes its last column, as csv.DictReader did;
+        # missing trailing cells count as empty.
+        columns_data: dict[str, list[str]] = {h: [] for h in headers}
+        last_index = {h: i for i, h in enumerate(headers)}
+        appends = [(columns_data[h].append, i) for h, i in last_index.items()]
+        row_count = 0
+        for row in reader:
+            if not row:
+                continue
+            row_count += 1
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            for append, i in appends:
+                append(row[i])
+    return headers, row_count, columns_data
+
+
+def profile_columns(
+    headers: list[str], row_count: int, columns_data: dict[str, list[str]]
+) -> list[dict[str, Any]]:
+    """Profile every column, in a process pool when the table is big enough to pay for it."""
+    columns = [columns_data[h] for h in headers]
+    if (
+        (os.cpu_count() or 1) > 1
+        and len(headers) >= _PARALLEL_MIN_COLUMNS
+        and len(headers) * row_count >= _PARALLEL_MIN_CELLS
+    ):
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(profile_column, headers, columns))
+    return [profile_column(h, c) for h, c in zip(headers, columns, strict=True)]
+
+
 def profile_csv(csv_path: Path) -> dict[str, Any]:
     """Profile an entire CSV file."""
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames or []
-        rows = list(reader)
-
-    columns_data: dict[str, list[str]] = {h: [] for h in headers}
-    for row in rows:
-        for h in headers:
-            columns_data[h].append(row.get(h, ""))
+    headers, row_count, columns_data = read_columns(csv_path)
 
     return {
         "file_path": str(csv_path.absolute()),
         "file_size_bytes": csv_path.stat().st_size,
-        "row_count": len(rows),
+        "row_count": row_count,
         "column_count": len(headers),
         "profiled_at": datetime.now().isoformat(),
-        "columns": [profile_column(h, columns_data[h]) for h in headers],
+        "columns": profile_columns(headers, row_count, columns_data),
     }
 
 
 def generate_markdown(profile: dict[str, Any]) -> str:
     """Generate markdown report from profile."""
-    lines = [
-        "# Dataset Profile",
-        "",
-        "## Overview",
-        f"- **File:** `{profile['file_path']}`",
-        f"- **Size:** {profile['file_size_bytes']} bytes",
-        f"- **Rows:** {profile['row_count']}",
-        f"- **Columns:** {profile['column_count']}",
-        f"- **Profiled at:** {profile['profiled_at']}",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        "# Dataset Profile\n\n## Overview\n"
+        f"- **File:** `{profile['file_path']}`\n"
+        f"- **Size:** {profile['file_size_bytes']} bytes\n"
+        f"- **Rows:** {profile['row_count']}\n"
+        f"- **Columns:** {profile['column_count']}\n"
+        f"- **Profiled at:** {profile['profiled_at']}\n"
+    )
 
     for col in profile["columns"]:
-        lines.extend([
-            f"## {col['name']}",
-            f"- **Type:** {col['dtype']}",
-            f"- **Null Count:** {col['null_count']} ({col['null_rate']:.1%})",
-            f"- **Unique Values:** {col['unique_count']}",
-        ])
+        unique_prefix = "> " if col["unique_count_capped"] else ""
+        w(
+            f"\n## {col['name']}\n"
+            f"- **Type:** {col['dtype']}\n"
+            f"- **Null Count:** {col['null_count']} ({col['null_rate']:.1%})\n"
+            f"- **Unique Values:** {unique_prefix}{col['unique_count']}\n"
+        )
 
         if col["dtype"] in ("integer", "float"):
             if "min_value" in col:
-                lines.append(f"- **Range:** [{col['min_value']}, {col['max_value']}]")
+                w(f"- **Range:** [{col['min_value']}, {col['max_value']}]\n")
             if "mean_value" in col:
-                lines.append(f"- **Mean:** {col['mean_value']:.2f}")
+                w(f"- **Mean:** {col['mean_value']:.2f}\n")
 
         if col["dtype"] == "string" and "min_length" in col:
-            lines.append(f"- **Length Range:** [{col['min_length']}, {col['max_length']}]")
+            w(f"- **Length Range:** [{col['min_length']}, {col['max_length']}]\n")
 
-        lines.append(f"- **Samples:** {', '.join(col['sample_values'][:3])}")
-        lines.append("")
+        w(f"- **Samples:** {', '.join(col['sample_values'][:3])}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main(csv_path: str, output_dir: str = "./out/profile_dataset") -> int:
@@ -160,8 +332,11 @@ def main(csv_path: str, output_dir: str = "./out/profile_dataset") -> int:
 
     # Write JSON
     json_path = out_dir / "profile.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(profile, f, indent=2)
+    if _HAS_ORJSON:
+        json_path.write_bytes(orjson.dumps(profile, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
     print(f"Wrote: {json_path}")
 
     # Write Markdown
@@ -2,8 +2,6 @@
 
 from pathlib import Path
 
-import pytest
-
 from skillpack.skills.data_quality import (
     generate_data_quality,
     generate_example_config,
@@ -2,8 +2,6 @@
 
 from pathlib import Path
 
-import pytest
-
 from skillpack.skills.dbt_generator import (
     generate_dbt,
     generate_schema_yml,
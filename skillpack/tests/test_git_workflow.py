@@ -4,8 +4,6 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-import pytest
-
 from skillpack.skills.git_workflow import (
     create_branch,
     format_commit,
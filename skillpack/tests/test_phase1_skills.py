@@ -3,8 +3,6 @@
 import tempfile
 from pathlib import Path
 
-import pytest
-
 
 class TestNotebookToPackage:
     """Tests for notebook-to-package skill."""
@@ -35,6 +33,25 @@ class TestNotebookToPackage:
             assert result["success"] is True
             assert "mypackage" in result["package_name"]
 
+    def test_scan_notebook_collects_imports_after_def(self):
+        """Test that imports following a def in the same cell are kept."""
+        from skillpack.skills.notebook_to_package import scan_notebook
+
+        cells = [
+            {"cell_type": "code", "source": ["import os\n", "def f():\n", "    import json\n"]},
+            {"cell_type": "code", "source": ["class A:\n", "    def m(self): pass"]},
+            {"cell_type": "markdown", "source": ["import nothing"]},
+        ]
+        contents = scan_notebook(cells)
+        modules = contents.modules
+
+        assert modules["imports"] == ["import os", "    import json"]
+        assert len(modules["functions"]) == 1
+        assert len(modules["classes"]) == 1
+        assert contents.functions[0] == "def f():"
+        assert contents.docs == ["import nothing"]
+        assert contents.dependencies == set()
+
 
 class TestTestWriter:
     """Tests for test-writer skill."""
@@ -99,3 +116,145 @@ def simple_function():
             )
 
             assert result["success"] is True
+
+    def test_scan_tree_function_metrics(self):
+        """Test the metrics a single-walk scan gathers for each function."""
+        import ast
+
+        from skillpack.skills.refactor_skill import (
+            calculate_cyclomatic_complexity,
+            calculate_nesting_depth,
+            scan_tree,
+        )
+
+        tree = ast.parse("""
+def outer(a, b):
+    if a and b:
+        for x in a:
+            while x:
+                def inner():
+                    return [y for y in b if y]
+                with open(x):
+                    try:
+                        pass
+                    except ValueError:
+                        pass
+    return a or b
+
+class Thing:
+    def method(self):
+        return 1
+""")
+        scan = scan_tree(tree)
+        defs = [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
+
+        assert [f.name for f in scan.functions] == ["outer", "method", "inner"]
+        assert [f.complexity for f in scan.functions] == [9, 1, 3]
+        assert [f.depth for f in scan.functions] == [5, 0, 0]
+        for func, node in zip(scan.functions, defs, strict=True):
+            assert func.name == node.name
+            assert calculate_cyclomatic_complexity(node) == func.complexity
+            assert calculate_nesting_depth(node) == func.depth
+        assert scan.functions[0].nested == 1
+        assert scan.classes == [{"name": "Thing", "line": 15, "methods": 1}]
+
+    def test_scan_tree_finds_defs_under_module_statements(self):
+        """Test that defs inside module-level control flow are still found."""
+        import ast
+
+        from skillpack.skills.refactor_skill import scan_tree
+
+        tree = ast.parse("""
+TABLE = {"a": [x for x in range(3) if x]}
+try:
+    import fast
+except ImportError:
+    def fallback():
+        return 1
+if TABLE:
+    class Config:
+        handler = lambda self: 0
+        def load(self):
+            return TABLE or {}
+""")
+        scan = scan_tree(tree)
+
+        assert [f.name for f in scan.functions] == ["fallback", "load"]
+        assert scan.functions[1].complexity == 2
+        assert scan.classes == [{"name": "Config", "line": 9, "methods": 1}]
+
+    def test_refactor_skill_directory_parallel(self, monkeypatch):
+        """Test that a directory analyzed in worker processes matches a serial run."""
+        import json
+
+        from skillpack.skills import refactor_skill
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "src"
+            source_dir.mkdir()
+            for i in range(5):
+                (source_dir / f"mod{i}.py").write_text(
+                    f"def f{i}(a, b, c, d, e, f):\n    return a if b else c\n"
+                )
+            (source_dir / "broken.py").write_text("def oops(:\n")
+
+            results = []
+            for min_files in (1, 1000):
+                monkeypatch.setattr(refactor_skill, "_PARALLEL_MIN_FILES", min_files)
+                output_dir = Path(tmpdir) / f"out{min_files}"
+                result = refactor_skill.refactor_skill_main(
+                    source_path=source_dir, threshold=1, output_dir=output_dir
+                )
+                metrics = json.loads((output_dir / "metrics.json").read_text())
+                del metrics["generated"]
+                results.append((result["hotspot_count"], metrics))
+
+            assert results[0] == results[1]
+            assert results[0][0] == 5
+            assert len(results[0][1]["files"]) == 5
+
+    def test_generate_suggestions_dispatches_on_issue_tags(self):
+        """Test that each tagged issue maps to its suggestion type."""
+        import ast
+        import json
+
+        from skillpack.skills.refactor_skill import (
+            IssueTag,
+            find_hotspots,
+            generate_metrics_json,
+            generate_suggestions,
+        )
+
+        source = "def f(a, b, c, d, e, g):\n    def inner():\n        pass\n    return a if b else c\n"
+        tree = ast.parse(source)
+        path = Path("mod.py")
+        hotspots = find_hotspots(path, tree, source, threshold=0)
+        suggestions = generate_suggestions(path, tree, source, hotspots)
+
+        assert hotspots[0]["issue_tags"] == [
+            IssueTag.HIGH_COMPLEXITY,
+            IssueTag.TOO_MANY_ARGS,
+            IssueTag.NESTED,
+        ]
+        assert [s["type"] for s in suggestions if s["function"] == "f"] == [
+            "extract_method",
+            "introduce_parameter_object",
+        ]
+        assert "issue_tags" not in json.loads(generate_metrics_json([], hotspots))["hotspots"][0]
+
+    def test_iter_py_files_walks_subdirectories(self):
+        """Test that nested .py files are found and *.py directories skipped."""
+        from skillpack.skills.refactor_skill import _iter_py_files
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "pkg" / "sub").mkdir(parents=True)
+            (root / "not_a_module.py").mkdir()
+            (root / "top.py").write_text("")
+            (root / "pkg" / "mod.py").write_text("")
+            (root / "pkg" / "sub" / "deep.py").write_text("")
+            (root / "pkg" / "notes.txt").write_text("")
+
+            found = {p.relative_to(root).as_posix() for p in _iter_py_files(root)}
+
+        assert found == {"top.py", "pkg/mod.py", "pkg/sub/deep.py"}
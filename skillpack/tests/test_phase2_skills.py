@@ -64,6 +64,14 @@ class TestBackfillPlanner:
 class TestPipelineDoctor:
     """Tests for pipeline-doctor skill."""
 
+    @pytest.fixture(autouse=True)
+    def isolate_user_files(self, tmp_path, monkeypatch):
+        """Keep the cache and user patterns of the developer's home out of the tests."""
+        from skillpack.skills import pipeline_doctor
+
+        monkeypatch.setattr(pipeline_doctor, "_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(pipeline_doctor, "_USER_PATTERNS_PATH", tmp_path / "patterns.yaml")
+
     def test_pipeline_doctor_main(self):
         """Test diagnosing pipeline from logs."""
         from skillpack.skills.pipeline_doctor import pipeline_doctor_main
@@ -88,6 +96,136 @@ class TestPipelineDoctor:
             assert result["success"] is True
             assert result["error_count"] >= 2
 
+    def test_pipeline_doctor_log_directory(self, tmp_path):
+        """Test diagnosing a directory of logs analyzed in parallel."""
+        from skillpack.skills.pipeline_doctor import pipeline_doctor_main
+
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        for n in range(4):
+            (log_dir / f"job{n}.log").write_text(
+                f"2024-01-15 10:0{n}:00 ERROR Connection refused to database\n"
+            )
+
+        result = pipeline_doctor_main(log_path=log_dir, output_dir=tmp_path / "output")
+
+        assert result["success"] is True
+        assert result["log_files_analyzed"] == 4
+        assert result["error_count"] == 4
+
+    def test_analyze_log_cached_reuses_result(self, tmp_path, monkeypatch):
+        """Test that unchanged logs are served from the cache."""
+        from skillpack.skills import pipeline_doctor
+
+        monkeypatch.setattr(pipeline_doctor, "_CACHE_DIR", tmp_path / "cache")
+        log_path = tmp_path / "pipeline.log"
+        log_path.write_text("ERROR: boom\n")
+
+        first = pipeline_doctor.analyze_log_cached(log_path)
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        monkeypatch.setattr(pipeline_doctor, "analyze_log", None)
+        assert pipeline_doctor.analyze_log_cached(log_path) == first
+
+    def test_analyze_log_cached_replaces_stale_entry(self, tmp_path):
+        """Test that an entry that no longer unpickles is dropped and rebuilt."""
+        from skillpack.skills import pipeline_doctor
+
+        log_path = tmp_path / "pipeline.log"
+        log_path.write_text("ERROR: boom\n")
+        first = pipeline_doctor.analyze_log_cached(log_path)
+        (entry,) = (tmp_path / "cache").iterdir()
+        # A pickle naming a class that no longer exists raises AttributeError
+        entry.write_bytes(b"cskillpack.skills.pipeline_doctor\nRenamedIssue\n.")
+
+        assert pipeline_doctor.analyze_log_cached(log_path) == first
+        assert pipeline_doctor.analyze_log_cached(log_path) == first
+        assert entry.read_bytes() != b"cskillpack.skills.pipeline_doctor\nRenamedIssue\n."
+
+    def test_prune_log_cache_keeps_recent_entries(self, tmp_path, monkeypatch):
+        """Test that a run prunes the cache down to the newest entries."""
+        import os
+
+        from skillpack.skills import pipeline_doctor
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        for n in range(5):
+            entry = cache_dir / f"old{n}.pkl"
+            entry.write_bytes(b"")
+            os.utime(entry, ns=(n, n))
+        monkeypatch.setattr(pipeline_doctor, "_CACHE_MAX_ENTRIES", 3)
+        log_path = tmp_path / "pipeline.log"
+        log_path.write_text("ERROR: boom\n")
+
+        pipeline_doctor.pipeline_doctor_main(log_path=log_path, output_dir=tmp_path / "output")
+
+        remaining = sorted(p.name for p in cache_dir.iterdir())
+        assert len(remaining) == 3
+        assert {"old3.pkl", "old4.pkl"} <= set(remaining)
+        assert pipeline_doctor.prune_log_cache(max_entries=0) == 3
+        assert not list(cache_dir.iterdir())
+
+    def test_pipeline_doctor_user_patterns(self, tmp_path):
+        """Test that site-specific patterns from YAML are matched first."""
+        from skillpack.skills.pipeline_doctor import pipeline_doctor_main
+
+        patterns_path = tmp_path / "patterns.yaml"
+        patterns_path.write_text(
+            "patterns:\n"
+            "  - pattern: 'ORA-(\\d{5})'\n"
+            "    severity: error\n"
+            "    description: Oracle error\n"
+        )
+        log_path = tmp_path / "pipeline.log"
+        log_path.write_text("ORA-00942 table missing\nwarning: ORA-01555 snapshot too old\n")
+
+        output_dir = tmp_path / "output"
+        result = pipeline_doctor_main(
+            log_path=log_path,
+            output_dir=output_dir,
+            use_cache=False,
+            patterns_path=patterns_path,
+        )
+
+        assert result["success"] is True
+        assert result["error_count"] == 2
+        assert result["warning_count"] == 0
+        assert "Oracle error" in (output_dir / "diagnosis.md").read_text()
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["(?i)ora-\\d+", "(a)\\1", "(?P<p0>x)"],
+        ids=["global-flag", "numbered-backref", "group-name-clash"],
+    )
+    def test_load_log_patterns_rejects_unjoinable_patterns(self, tmp_path, pattern):
+        """Test that patterns which break the combined matcher are reported."""
+        from skillpack.skills.pipeline_doctor import load_log_patterns
+
+        patterns_path = tmp_path / "patterns.yaml"
+        patterns_path.write_text(
+            "patterns:\n"
+            "  - pattern: 'Snowflake (?P<code>\\d+)'\n"
+            f"  - pattern: '{pattern}'\n"
+        )
+
+        with pytest.raises(ValueError, match="Invalid log pattern") as excinfo:
+            load_log_patterns(patterns_path)
+        assert repr(pattern) in str(excinfo.value)
+
+    def test_analyze_log_first_pattern_wins(self, tmp_path):
+        """Test that each line is classified by the first matching pattern."""
+        from skillpack.skills.pipeline_doctor import analyze_log
+
+        log_path = tmp_path / "pipeline.log"
+        log_path.write_text("Retrying after error: boom\nall good\nrate limit hit, retry later\n")
+        issues, _, _ = analyze_log(log_path)
+
+        assert [(i.line, i.description) for i in issues] == [
+            (1, "Error detected"),
+            (3, "Rate limiting"),
+        ]
+
 
 class TestDailyOpsSummary:
     """Tests for daily-ops-summary skill."""
@@ -3,8 +3,6 @@
 import tempfile
 from pathlib import Path
 
-import pytest
-
 
 class TestBaselineModelFactory:
     """Tests for baseline-model-factory skill."""
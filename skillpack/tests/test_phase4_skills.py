@@ -1,99 +1,52 @@
 """Tests for Phase 4 infrastructure/serving skills."""
 
-import tempfile
+import importlib
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 
-class TestFastapiServing:
-    """Tests for fastapi-serving skill."""
-
-    def test_fastapi_serving_main(self):
-        """Test generating FastAPI service."""
-        from skillpack.skills.fastapi_serving import fastapi_serving_main
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "output"
-            result = fastapi_serving_main(
-                model_name="test_api",  # Correct param (not service_name)
-                model_type="sklearn",
-                output_dir=output_dir,
-            )
-
-            assert result["success"] is True
-
-
-class TestContainerization:
-    """Tests for containerization skill."""
-
-    def test_containerization_python(self):
-        """Test generating Python Dockerfile."""
-        from skillpack.skills.containerization import containerization_main
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "output"
-            result = containerization_main(
-                service_name="test_service",
-                base_image="python",
-                runtime="uvicorn",  # Correct runtime
-                port=8000,
-                output_dir=output_dir,
-            )
-
-            assert result["success"] is True
-
-
-class TestIacBoilerplate:
-    """Tests for iac-boilerplate skill."""
-
-    def test_iac_boilerplate_aws(self):
-        """Test generating AWS Terraform."""
-        from skillpack.skills.iac_boilerplate import iac_boilerplate_main
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "output"
-            result = iac_boilerplate_main(
-                project_name="test_infra",
-                cloud="aws",
-                resources=["compute", "storage"],
-                output_dir=output_dir,
-            )
-
-            assert result["success"] is True
-
-
-class TestMonitoringDrift:
-    """Tests for monitoring-drift skill."""
-
-    def test_monitoring_drift_main(self):
-        """Test generating drift monitors."""
-        from skillpack.skills.monitoring_drift import monitoring_drift_main
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "output"
-            result = monitoring_drift_main(
-                model_name="test_model",
-                drift_type="both",
-                output_dir=output_dir,
-            )
-
-            assert result["success"] is True
-
-
-class TestCostRegression:
-    """Tests for cost-regression skill."""
-
-    def test_cost_regression_main(self):
-        """Test generating cost analyzer."""
-        from skillpack.skills.cost_regression import cost_regression_main
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "output"
-            result = cost_regression_main(
-                project_name="test_project",
-                threshold=0.1,
-                output_dir=output_dir,
-            )
-
-            assert result["success"] is True
+@pytest.mark.parametrize(
+    ("skill_module", "kwargs"),
+    [
+        pytest.param(
+            "fastapi_serving",
+            {"model_name": "test_api", "model_type": "sklearn"},
+            id="fastapi-serving",
+        ),
+        pytest.param(
+            "containerization",
+            {
+                "service_name": "test_service",
+                "base_image": "python",
+                "runtime": "uvicorn",
+                "port": 8000,
+            },
+            id="containerization-python",
+        ),
+        pytest.param(
+            "iac_boilerplate",
+            {"project_name": "test_infra", "cloud": "aws", "resources": ["compute", "storage"]},
+            id="iac-boilerplate-aws",
+        ),
+        pytest.param(
+            "monitoring_drift",
+            {"model_name": "test_model", "drift_type": "both"},
+            id="monitoring-drift",
+        ),
+        pytest.param(
+            "cost_regression",
+            {"project_name": "test_project", "threshold": 0.1},
+            id="cost-regression",
+        ),
+    ],
+)
+def test_skill_main(tmp_path: Path, skill_module: str, kwargs: dict[str, Any]) -> None:
+    """Test that each Phase 4 skill generates its output successfully."""
+    module = importlib.import_module(f"skillpack.skills.{skill_module}")
+    skill_main = getattr(module, f"{skill_module}_main")
+
+    result = skill_main(**kwargs, output_dir=tmp_path / "output")
+
+    assert result["success"] is True
@@ -10,6 +10,7 @@ from skillpack.skills.pr_summary import (
     generate_pr_summary,
     generate_summary,
     parse_diff,
+    parse_diff_lines,
 )
 
 
@@ -28,43 +29,101 @@ index abc1234..def5678 100644
 """
 
 
-def test_parse_diff_extracts_files() -> None:
-    """Test that parse_diff extracts file names."""
+def test_parse_diff_extracts_stats() -> None:
+    """Test that parse_diff extracts file names and counts changes."""
     stats = parse_diff(SAMPLE_DIFF)
     assert "src/main.py" in stats.files_changed
-
-
-def test_parse_diff_counts_changes() -> None:
-    """Test that parse_diff counts insertions and deletions."""
-    stats = parse_diff(SAMPLE_DIFF)
     assert stats.insertions > 0
     assert stats.deletions > 0
 
 
-def test_assess_risk_low() -> None:
-    """Test risk assessment for small changes."""
-    stats = DiffStats(
-        files_changed=["file1.py"],
-        insertions=10,
-        deletions=5,
-        binary_files=[],
-        file_types={".py": 1},
-    )
-    level, factors = assess_risk(stats)
-    assert "LOW" in level
+def test_parse_diff_lists_each_file_once() -> None:
+    """Test that a file named by several headers is counted once."""
+    stats = parse_diff(SAMPLE_DIFF + SAMPLE_DIFF.replace("src/main.py", "Makefile"))
+    assert stats.files_changed == ["Makefile", "src/main.py"]
+    assert stats.file_types == {"(no ext)": 1, ".py": 1}
+
+
+def test_parse_diff_new_and_binary_files() -> None:
+    """Test that added files and binary changes are picked up."""
+    diff = """diff --git a/docs/new.md b/docs/new.md
+new file mode 100644
+--- /dev/null
++++ b/docs/new.md
+@@ -0,0 +1 @@
++hello
+diff --git a/logo.png b/logo.png
+Binary files a/logo.png and b/logo.png differ
+"""
+    stats = parse_diff(diff)
+    assert stats.files_changed == ["docs/new.md", "logo.png"]
+    assert stats.binary_files == ["(binary)"]
+    assert stats.insertions == 1
+    assert stats.deletions == 0
+
+
+def test_parse_diff_matches_line_parser() -> None:
+    """Test that the bulk-count parser agrees with the streaming parser."""
+    diff = SAMPLE_DIFF + """diff --git a/old.sql b/old.sql
+deleted file mode 100644
+--- a/old.sql
++++ /dev/null
+@@ -1,2 +0,0 @@
+--- a SQL comment
+-DROP TABLE users;
+"""
+    assert parse_diff(diff) == parse_diff_lines(diff.splitlines(keepends=True))
+
+
+@pytest.mark.parametrize(
+    ("stats", "expected"),
+    [
+        pytest.param(
+            DiffStats(
+                files_changed=["file1.py"],
+                insertions=10,
+                deletions=5,
+                binary_files=[],
+                file_types={".py": 1},
+            ),
+            {"LOW"},
+            id="small",
+        ),
+        pytest.param(
+            DiffStats(
+                files_changed=[f"file{i}.py" for i in range(25)],
+                insertions=500,
+                deletions=200,
+                binary_files=[],
+                file_types={".py": 25},
+            ),
+            {"HIGH", "MEDIUM"},
+            id="large",
+        ),
+    ],
+)
+def test_assess_risk(stats: DiffStats, expected: set[str]) -> None:
+    """Test risk assessment for small and large changes."""
+    level, _ = assess_risk(stats)
+    assert any(e in level for e in expected)
 
 
-def test_assess_risk_high() -> None:
-    """Test risk assessment for large changes."""
+def test_assess_risk_sensitive_files() -> None:
+    """Test that each sensitive pattern is reported once, in table order."""
     stats = DiffStats(
-        files_changed=[f"file{i}.py" for i in range(25)],
-        insertions=500,
-        deletions=200,
+        files_changed=["db/migrations/001_init.SQL", "ci.yml", "deploy.yml", "app.py"],
+        insertions=10,
+        deletions=5,
         binary_files=[],
-        file_types={".py": 25},
+        file_types={},
     )
     level, factors = assess_risk(stats)
-    assert "HIGH" in level or "MEDIUM" in level
+    assert factors == [
+        "Database schema changes",
+        "CI/CD or config changes",
+        "Database migration",
+    ]
+    assert "MEDIUM" in level
 
 
 def test_generate_summary_creates_markdown() -> None:
@@ -4,14 +4,17 @@ from pathlib import Path
 
 import pytest
 
+from skillpack.skills import profile_dataset
 from skillpack.skills.profile_dataset import (
+    _profile_sampled,
+    _profile_with_csv,
+    _profile_with_pandas,
     generate_profile,
     infer_dtype,
     profile_column,
     profile_csv,
 )
 
-
 SAMPLE_CSV = """id,name,age,active
 1,Alice,28,true
 2,Bob,35,false
@@ -27,24 +30,27 @@ def csv_file(tmp_path: Path) -> Path:
     return csv_path
 
 
-def test_infer_dtype_integer() -> None:
-    """Test integer type inference."""
-    assert infer_dtype(["1", "2", "3"]) == "integer"
-
-
-def test_infer_dtype_float() -> None:
-    """Test float type inference."""
-    assert infer_dtype(["1.5", "2.5", "3.5"]) == "float"
-
-
-def test_infer_dtype_boolean() -> None:
-    """Test boolean type inference."""
-    assert infer_dtype(["true", "false", "true"]) == "boolean"
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (["1", "2", "3"], "integer"),
+        (["1.5", "2.5", "3.5"], "float"),
+        (["true", "false", "true"], "boolean"),
+        (["hello", "world"], "string"),
+    ],
+)
+def test_infer_dtype(values: list[str], expected: str) -> None:
+    """Test inference of each basic type."""
+    assert infer_dtype(values) == expected
 
 
-def test_infer_dtype_string() -> None:
-    """Test string type inference."""
-    assert infer_dtype(["hello", "world"]) == "string"
+def test_infer_dtype_mixed() -> None:
+    """Test inference on mixed and blank values."""
+    assert infer_dtype(["1", "", "0"]) == "boolean"
+    assert infer_dtype(["1", " 20 ", "-3"]) == "integer"
+    assert infer_dtype(["1", ".5", "2e3"]) == "float"
+    assert infer_dtype(["abc", "1"]) == "string"
+    assert infer_dtype(["", " "]) == "string"
 
 
 def test_profile_column_basic() -> None:
@@ -56,6 +62,31 @@ def test_profile_column_basic() -> None:
     assert profile.unique_count == 3
 
 
+def test_profile_column_stats() -> None:
+    """Test numeric and string statistics."""
+    numeric = profile_column("n", ["1", "2", " ", "3.5"])
+    assert numeric.dtype == "float"
+    assert numeric.null_count == 1
+    assert (numeric.min_value, numeric.max_value) == (1.0, 3.5)
+    assert numeric.median_value == 2.0
+
+    text = profile_column("s", ["a", "bbb", "", "a"])
+    assert text.dtype == "string"
+    assert (text.min_length, text.max_length) == (1, 3)
+    assert text.avg_length == pytest.approx(5 / 3)
+
+
+def test_profile_column_caps_unique_count() -> None:
+    """Test that ID-like columns stop counting distinct values at the limit."""
+    values = [str(i) for i in range(profile_dataset._UNIQUE_LIMIT + 500)]
+    profile = profile_column("id", values)
+
+    assert profile.unique_capped is True
+    assert profile.unique_count == profile_dataset._UNIQUE_LIMIT
+    assert profile.sample_values == ["0", "1", "2", "3", "4"]
+    assert profile.max_value == len(values) - 1
+
+
 def test_profile_csv_creates_profile(csv_file: Path) -> None:
     """Test that profile_csv creates a valid profile."""
     profile = profile_csv(csv_file)
@@ -64,6 +95,88 @@ def test_profile_csv_creates_profile(csv_file: Path) -> None:
     assert len(profile.columns) == 4
 
 
+def test_pandas_profile_matches_csv_profile(csv_file: Path) -> None:
+    """Test that the pandas and csv module paths agree."""
+    pandas_rows, pandas_columns = _profile_with_pandas(csv_file)
+    csv_rows, csv_columns = _profile_with_csv(csv_file)
+
+    assert pandas_rows == csv_rows
+    assert pandas_columns == csv_columns
+
+
+def test_profile_paths_share_dtype_inference(tmp_path: Path) -> None:
+    """Test that the pandas, csv and sampled paths infer the same profiles."""
+    csv_path = tmp_path / "special.csv"
+    csv_path.write_text("grouped,special\n1_000,nan\n2_000,inf\n3,1.5\n")
+
+    _, pandas_columns = _profile_with_pandas(csv_path)
+    _, csv_columns = _profile_with_csv(csv_path)
+    _, sampled_columns, _ = _profile_sampled(csv_path, 10)
+
+    assert [c.dtype for c in pandas_columns] == ["integer", "float"]
+    # repr() so NaN statistics compare equal
+    assert repr(pandas_columns) == repr(csv_columns) == repr(sampled_columns)
+
+
+def test_profile_csv_ragged_rows(tmp_path: Path) -> None:
+    """Test that rows with extra fields fall back to the csv module."""
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text("a,b,c\n1,x,2\n3,y,4,EXTRA\n5,z,6\n")
+
+    profile = profile_csv(csv_path)
+    assert profile.row_count == 3
+    assert [c.dtype for c in profile.columns] == ["integer", "string", "integer"]
+    assert (profile.row_count, profile.columns) == _profile_with_csv(csv_path)
+
+
+def test_profile_csv_extra_field_on_every_row(tmp_path: Path) -> None:
+    """Test that extra fields on every row do not shift the columns."""
+    csv_path = tmp_path / "wide_rows.csv"
+    csv_path.write_text("a,b\n1,2,3\n4,5,6\n")
+
+    profile = profile_csv(csv_path)
+    assert [c.sample_values for c in profile.columns] == [["1", "4"], ["2", "5"]]
+    assert (profile.row_count, profile.columns) == _profile_with_csv(csv_path)
+
+
+def test_profile_csv_with_bom(tmp_path: Path) -> None:
+    """Test that a UTF-8 byte order mark does not change the first column."""
+    csv_path = tmp_path / "bom.csv"
+    csv_path.write_bytes(b"\xef\xbb\xbfid,name\n1,a\n2,b\n")
+
+    profile = profile_csv(csv_path)
+    assert [(c.name, c.dtype) for c in profile.columns] == [("id", "integer"), ("name", "string")]
+    assert profile.columns[0].sample_values == ["1", "2"]
+
+
+def test_profile_csv_parallel_matches_sequential(
+    csv_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that profiling columns in a process pool gives the same result."""
+    sequential = profile_csv(csv_file)
+
+    monkeypatch.setattr(profile_dataset, "_PARALLEL_MIN_COLUMNS", 1)
+    monkeypatch.setattr(profile_dataset, "_PARALLEL_MIN_CELLS", 1)
+    parallel = profile_csv(csv_file)
+
+    assert parallel.columns == sequential.columns
+
+
+def test_profile_csv_sampled(tmp_path: Path) -> None:
+    """Test that a sampled profile keeps the exact row count."""
+    csv_path = tmp_path / "big.csv"
+    csv_path.write_text("id,flag\n" + "".join(f"{i},{i % 2}\n" for i in range(1000)))
+
+    profile = profile_csv(csv_path, sample_size=100)
+    assert profile.row_count == 1000
+    assert profile.sampled_rows == 100
+    assert profile.columns[0].total_count == 100
+    assert profile.columns[0].dtype == "integer"
+
+    # A sample larger than the file profiles every row
+    assert profile_csv(csv_path, sample_size=5000).sampled_rows is None
+
+
 def test_generate_profile_creates_files(csv_file: Path, tmp_path: Path) -> None:
     """Test that generate_profile creates output files."""
     md_path, json_path = generate_profile(
@@ -1,6 +1,5 @@
 """Tests for project_scaffolding skill."""
 
-import shutil
 from pathlib import Path
 
 import pytest
@@ -8,23 +7,21 @@ import pytest
 from skillpack.skills.project_scaffolding import generate_project
 
 
-@pytest.fixture
-def output_dir(tmp_path: Path) -> Path:
-    """Create a temporary output directory."""
-    return tmp_path / "out"
+@pytest.fixture(scope="module")
+def project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Generate one project for every test in this module to inspect."""
+    return generate_project(
+        name="myapp",
+        description="My awesome app",
+        base_dir=str(tmp_path_factory.mktemp("out")),
+    )
 
 
-def test_generate_project_creates_files(output_dir: Path) -> None:
+def test_generate_project_creates_files(project_dir: Path) -> None:
     """Test that generate_project creates all expected files."""
-    project_dir = generate_project(
-        name="testproject",
-        description="A test project",
-        base_dir=str(output_dir),
-    )
-
     # Check project directory exists
     assert project_dir.exists()
-    assert project_dir.name == "testproject"
+    assert project_dir.name == "myapp"
 
     # Check required files exist
     assert (project_dir / "pyproject.toml").exists()
@@ -34,14 +31,8 @@ def test_generate_project_creates_files(output_dir: Path) -> None:
     assert (project_dir / "tests" / "test_main.py").exists()
 
 
-def test_generate_project_content(output_dir: Path) -> None:
+def test_generate_project_content(project_dir: Path) -> None:
     """Test that generated files have correct content."""
-    project_dir = generate_project(
-        name="myapp",
-        description="My awesome app",
-        base_dir=str(output_dir),
-    )
-
     # Check pyproject.toml content
     pyproject = (project_dir / "pyproject.toml").read_text()
     assert 'name = "myapp"' in pyproject
@@ -50,3 +41,9 @@ def test_generate_project_content(output_dir: Path) -> None:
     readme = (project_dir / "README.md").read_text()
     assert "# myapp" in readme
     assert "My awesome app" in readme
+
+    # Escaped braces are unescaped, files without placeholders are verbatim
+    settings = (project_dir / ".vscode" / "settings.json").read_text()
+    assert settings.startswith("{\n")
+    gitignore = (project_dir / ".gitignore").read_text()
+    assert "*.py[cod]" in gitignore
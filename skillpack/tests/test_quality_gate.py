@@ -1,8 +1,11 @@
 """Tests for quality_gate skill."""
 
+import asyncio
+import sys
+
 import pytest
 
-from skillpack.skills.quality_gate import run_command
+from skillpack.skills.quality_gate import _run_concurrently, run_command, run_command_async
 
 
 def test_run_command_success() -> None:
@@ -21,6 +24,48 @@ def test_run_command_not_found() -> None:
 
 def test_run_command_with_args() -> None:
     """Test run_command with arguments."""
-    code, stdout, stderr = run_command(["python", "--version"])
+    code, stdout, stderr = run_command([sys.executable, "--version"])
     assert code == 0
     assert "Python" in stdout or "Python" in stderr
+
+
+def test_run_concurrently_keeps_order() -> None:
+    """Test that concurrent commands report results in submission order."""
+    results = asyncio.run(
+        _run_concurrently([
+            [sys.executable, "-c", "import sys; sys.exit(3)"],
+            [sys.executable, "-c", "print('second')"],
+            ["nonexistent_command_12345"],
+        ])
+    )
+    assert [code for code, _, _ in results] == [3, 0, 1]
+    assert "second" in results[1][1]
+    assert "not found" in results[2][2].lower()
+
+
+def test_run_command_stream_echoes_and_keeps_tail(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that streamed output is echoed live and only a tail is returned."""
+    code, stdout, _ = run_command(
+        [sys.executable, "-c", "for i in range(500): print(i)"],
+        stream=True,
+    )
+    captured = capsys.readouterr()
+
+    assert code == 0
+    assert captured.out.splitlines()[0] == "0"
+    assert stdout.splitlines() == [str(i) for i in range(300, 500)]
+
+
+def test_run_command_async_stream_long_lines(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that streaming copes with lines longer than the stream buffer limit."""
+    code, stdout, _ = asyncio.run(
+        run_command_async(
+            [sys.executable, "-c", "print('x' * 200_000); print('é' * 50_000, end='')"],
+            stream=True,
+        )
+    )
+    captured = capsys.readouterr()
+
+    assert code == 0
+    assert stdout == "x" * 200_000 + "\n" + "é" * 50_000
+    assert captured.out == stdout
@@ -1,12 +1,14 @@
 """Tests for schema_diff skill."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from skillpack.skills.schema_diff import (
     Column,
+    _parse_schema_dict,
     diff_schema,
     diff_schemas,
     parse_schema,
@@ -48,6 +50,35 @@ def test_parse_schema_creates_columns(schema_files: tuple[Path, Path]) -> None:
     assert isinstance(schema["id"], Column)
 
 
+def test_parse_schema_dict_creates_columns() -> None:
+    """Test that already-decoded schema JSON is turned into Column objects."""
+    schema = _parse_schema_dict(OLD_SCHEMA)
+    assert list(schema) == ["id", "email"]
+    assert schema["id"] == Column("id", "INTEGER", False, True)
+
+
+def test_parse_schema_rereads_changed_file(tmp_path: Path) -> None:
+    """Test that the parse cache notices when a schema file changes."""
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(OLD_SCHEMA))
+    assert list(parse_schema(path)) == ["id", "email"]
+
+    path.write_text(json.dumps(NEW_SCHEMA))
+    assert list(parse_schema(path)) == ["id", "email", "name"]
+
+
+def test_parse_schema_rereads_same_size_edit(tmp_path: Path) -> None:
+    """Test that an edit keeping the file size is caught by its mtime."""
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps({"columns": [{"name": "aa", "type": "INTEGER"}]}))
+    mtime_ns = path.stat().st_mtime_ns
+    assert list(parse_schema(path)) == ["aa"]
+
+    path.write_text(json.dumps({"columns": [{"name": "bb", "type": "INTEGER"}]}))
+    os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert list(parse_schema(path)) == ["bb"]
+
+
 def test_diff_schemas_detects_additions() -> None:
     """Test that diff detects added columns."""
     old = {"id": Column("id", "INTEGER", False, True)}
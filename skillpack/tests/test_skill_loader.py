@@ -7,11 +7,17 @@ import pytest
 from skillpack.utils.skill_loader import (
     export_skills_json,
     format_skill_for_llm,
+    get_dependency_graph,
+    get_reverse_dependencies,
+    get_skill_dependencies,
     get_skill_guardrails,
     get_skill_metadata,
     list_skills,
     load_skill,
     load_skill_full,
+    skill_exists,
+    validate_all_dependencies,
+    validate_dependencies,
 )
 
 
@@ -38,6 +44,66 @@ def test_get_skill_metadata() -> None:
     assert "description" in metadata
 
 
+def test_get_skill_metadata_reloads_changed_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cached metadata is re-read after an edit and not shared."""
+    from skillpack.utils import skill_loader
+
+    metadata_file = tmp_path / "demo" / "metadata.yaml"
+    metadata_file.parent.mkdir()
+    metadata_file.write_text("name: demo\ndescription: first\n")
+    monkeypatch.setattr(skill_loader, "get_skills_directory", lambda: tmp_path)
+
+    first = get_skill_metadata("demo")
+    first["description"] = "mutated"
+    assert get_skill_metadata("demo")["description"] == "first"
+
+    metadata_file.write_text("name: demo\ndescription: second one\n")
+    assert get_skill_metadata("demo")["description"] == "second one"
+
+
+def test_list_skills_falls_back_to_skill_yaml(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that old-format skills are listed and empty directories skipped."""
+    from skillpack.utils import skill_loader
+
+    (tmp_path / "new").mkdir()
+    (tmp_path / "new" / "metadata.yaml").write_text("name: new\n")
+    (tmp_path / "old").mkdir()
+    (tmp_path / "old" / "skill.yaml").write_text("skill:\n  name: old\n")
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "stray.yaml").write_text("name: stray\n")
+    monkeypatch.setattr(skill_loader, "get_skills_directory", lambda: tmp_path)
+
+    skills = skill_loader.list_skills()
+    assert [s["name"] for s in skills] == ["new", "old"]
+    assert skills[1]["_path"] == str(tmp_path / "old" / "skill.yaml")
+
+
+def test_load_skill_full_reads_text_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that tier-3 content translates newlines and skips binary files."""
+    from skillpack.utils import skill_loader
+
+    skill_dir = tmp_path / "demo"
+    (skill_dir / "docs" / "nested.md").mkdir(parents=True)
+    (skill_dir / "examples").mkdir()
+    (skill_dir / "metadata.yaml").write_text("name: demo\n")
+    (skill_dir / "docs" / "guide.md").write_bytes(b"one\r\ntwo\rthree\n")
+    (skill_dir / "docs" / "notes.txt").write_text("ignored")
+    (skill_dir / "examples" / "data.bin").write_bytes(b"\xff\xfe\x00")
+    (skill_dir / "examples" / "usage.sh").write_text("echo hi\n")
+    monkeypatch.setattr(skill_loader, "get_skills_directory", lambda: tmp_path)
+
+    skill = skill_loader.load_skill_full("demo")
+    assert skill["docs"] == {"guide.md": "one\ntwo\nthree\n"}
+    assert skill["scripts"] == {}
+    assert skill["examples_content"] == {"usage.sh": "echo hi\n"}
+
+
 def test_load_skill_tier2() -> None:
     """Test loading skill with procedure (Tier 2)."""
     skill = load_skill("profile-dataset")
@@ -61,6 +127,15 @@ def test_load_skill_full_tier3() -> None:
     assert "profile_csv.py" in skill.get("scripts", {})
 
 
+def test_load_skill_full_excludes_content() -> None:
+    """Test that excluded tier-3 content is not loaded."""
+    skill = load_skill_full("profile-dataset", include_scripts=False, include_examples=False)
+    assert "edge_cases.md" in skill["docs"]
+    assert "scripts" not in skill
+    assert "examples_content" not in skill
+    assert "profile_csv.py" in skill["available_scripts"]
+
+
 def test_load_skill_not_found() -> None:
     """Test that loading non-existent skill raises error."""
     with pytest.raises(FileNotFoundError):
@@ -103,6 +178,26 @@ def test_get_skill_guardrails() -> None:
     assert len(guardrails["forbidden"]) > 0
 
 
+def test_get_skill_guardrails_sections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that bullets are collected only under Allowed/Forbidden headings."""
+    from skillpack.utils import skill_loader
+
+    (tmp_path / "demo").mkdir()
+    (tmp_path / "demo" / "metadata.yaml").write_text("name: demo\n")
+    (tmp_path / "demo" / "skill.md").write_text(
+        "# Demo\n- intro\n## Allowed\n- read files  \n  - indented\n-\n"
+        "### Forbidden actions\n- push to main\n## Steps\n- not a guardrail\n"
+    )
+    monkeypatch.setattr(skill_loader, "get_skills_directory", lambda: tmp_path)
+
+    assert skill_loader.get_skill_guardrails("demo") == {
+        "allowed": ["read files", "indented"],
+        "forbidden": ["push to main"],
+    }
+
+
 def test_progressive_disclosure_efficiency() -> None:
     """Test that Tier 1 is more compact than Tier 3."""
     metadata = get_skill_metadata("profile-dataset")
@@ -122,16 +217,12 @@ def test_progressive_disclosure_efficiency() -> None:
 
 def test_skill_exists() -> None:
     """Test skill_exists returns correct values."""
-    from skillpack.utils.skill_loader import skill_exists
-    
     assert skill_exists("profile-dataset") is True
     assert skill_exists("nonexistent-skill") is False
 
 
 def test_get_skill_dependencies() -> None:
     """Test getting dependencies from a skill."""
-    from skillpack.utils.skill_loader import get_skill_dependencies
-    
     # data-quality declares profile-dataset as dependency
     deps = get_skill_dependencies("data-quality")
     assert isinstance(deps, list)
@@ -140,8 +231,6 @@ def test_get_skill_dependencies() -> None:
 
 def test_validate_dependencies_valid() -> None:
     """Test validating a skill with valid dependencies."""
-    from skillpack.utils.skill_loader import validate_dependencies
-    
     result = validate_dependencies("data-quality")
     assert result["valid"] is True
     assert "profile-dataset" in result["dependencies"]
@@ -150,8 +239,6 @@ def test_validate_dependencies_valid() -> None:
 
 def test_validate_all_dependencies() -> None:
     """Test validating all skills."""
-    from skillpack.utils.skill_loader import validate_all_dependencies
-    
     result = validate_all_dependencies()
     assert result["total_skills"] == 27
     assert "details" in result
@@ -159,8 +246,6 @@ def test_validate_all_dependencies() -> None:
 
 def test_get_dependency_graph() -> None:
     """Test building the dependency graph."""
-    from skillpack.utils.skill_loader import get_dependency_graph
-    
     graph = get_dependency_graph()
     assert len(graph) == 27
     assert "data-quality" in graph
@@ -169,8 +254,6 @@ def test_get_dependency_graph() -> None:
 
 def test_get_reverse_dependencies() -> None:
     """Test getting skills that depend on a given skill."""
-    from skillpack.utils.skill_loader import get_reverse_dependencies
-    
     # profile-dataset is a dependency of data-quality and dbt-generator
     dependents = get_reverse_dependencies("profile-dataset")
     assert "data-quality" in dependents
@@ -11,16 +11,17 @@ from skillpack.skills.sql_refiner import (
 )
 
 
-def test_extract_entities_count() -> None:
-    """Test entity extraction for count queries."""
-    entities = extract_entities("How many users are there")
-    assert "COUNT" in entities["aggregations"]
-
-
-def test_extract_entities_average() -> None:
-    """Test entity extraction for average queries."""
-    entities = extract_entities("What is the average order value")
-    assert "AVG" in entities["aggregations"]
+@pytest.mark.parametrize(
+    ("question", "aggregation"),
+    [
+        ("How many users are there", "COUNT"),
+        ("What is the average order value", "AVG"),
+    ],
+)
+def test_extract_entities_aggregation(question: str, aggregation: str) -> None:
+    """Test entity extraction for aggregate queries."""
+    entities = extract_entities(question)
+    assert aggregation in entities["aggregations"]
 
 
 def test_extract_entities_top() -> None:
@@ -30,18 +31,30 @@ def test_extract_entities_top() -> None:
     assert entities["ordering"] == "DESC"
 
 
-def test_generate_query_template_postgres() -> None:
-    """Test query template generation for PostgreSQL."""
-    query = generate_query_template("Count active users", "postgres")
-    assert "SELECT" in query
-    assert "COUNT" in query
-
-
-def test_generate_query_template_bigquery() -> None:
-    """Test query template generation for BigQuery."""
-    query = generate_query_template("Top 5 orders", "bigquery")
+def test_extract_entities_multiple_keywords() -> None:
+    """Test that every keyword class is detected from one question."""
+    entities = extract_entities("Total and maximum of the smallest active accounts, last 7 days")
+    assert entities["aggregations"] == ["COUNT", "SUM", "MAX", "MIN"]
+    assert entities["conditions"] == [
+        "status = 'active'",
+        "created_at >= NOW() - INTERVAL '7 days'",
+    ]
+    assert entities["ordering"] == "ASC"
+    assert entities["limit"] == 7
+
+
+@pytest.mark.parametrize(
+    ("question", "dialect", "fragment"),
+    [
+        ("Count active users", "postgres", "COUNT"),
+        ("Top 5 orders", "bigquery", "LIMIT 5"),
+    ],
+)
+def test_generate_query_template(question: str, dialect: str, fragment: str) -> None:
+    """Test query template generation for each dialect."""
+    query = generate_query_template(question, dialect)
     assert "SELECT" in query
-    assert "LIMIT 5" in query
+    assert fragment in query
 
 
 def test_refine_sql_creates_files(tmp_path: Path) -> None:
@@ -61,10 +74,11 @@ def test_refine_sql_creates_files(tmp_path: Path) -> None:
 
 
 def test_refine_sql_invalid_dialect(tmp_path: Path) -> None:
-    """Test that invalid dialect raises error."""
+    """Test that invalid dialect raises error before anything is written."""
     with pytest.raises(ValueError):
         refine_sql(
             question="test",
             dialect="invalid_dialect",
             base_dir=str(tmp_path / "out"),
         )
+    assert not (tmp_path / "out").exists()